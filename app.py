@@ -14,41 +14,124 @@ Features:
 - Audio feedback and visual indicators
 
 Requirements:
-pip install tkinter customtkinter pynput pyaudio whisper torch sounddevice numpy threading queue
+pip install tkinter customtkinter pynput faster-whisper sounddevice numpy orjson threading queue
 """
 
+import importlib.util
+import sys
+
+# Import name -> pip distribution name for the third-party imports below
+REQUIRED_PACKAGES = {
+    'customtkinter': 'customtkinter', 'orjson': 'orjson', 'faster_whisper': 'faster-whisper',
+    'numpy': 'numpy', 'scipy': 'scipy', 'sounddevice': 'sounddevice', 'pynput': 'pynput',
+    'pystray': 'pystray', 'PIL': 'Pillow', 'win32clipboard': 'pywin32'
+}
+
+
+def check_dependencies():
+    """Report missing packages (runs before the imports below, which would fail first)"""
+    missing_packages = [pip_name for module, pip_name in REQUIRED_PACKAGES.items()
+                        if importlib.util.find_spec(module) is None]
+
+    if missing_packages:
+        print("Missing required packages:")
+        for package in missing_packages:
+            print(f"  - {package}")
+        print("\nInstall missing packages with:")
+        print(f"pip install {' '.join(missing_packages)}")
+        return False
+    return True
+
+
+if __name__ == "__main__" and not check_dependencies():
+    sys.exit(1)
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import json
+import orjson
 import os
+import re
 import threading
 import queue
 import time
-import pyaudio
-import whisper
+import statistics
+import copy
+from contextlib import contextmanager
+from collections import deque
+import ctranslate2
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
 import numpy as np
+from math import gcd
+from scipy.signal import resample_poly
 import sounddevice as sd
 from pynput import keyboard, mouse
-from pynput.keyboard import Key, Listener as KeyboardListener
+from pynput.keyboard import Listener as KeyboardListener
 import pystray
 from pystray import MenuItem as item
 from PIL import Image, ImageDraw
 import logging
-import sys
 from pathlib import Path
 import winreg
 import subprocess
 import win32gui
 import win32con
+import win32api
+import win32clipboard
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Map pynput special key names to the names used in hotkey config
+_KEY_NAME_MAP = {
+    'ctrl_l': 'ctrl',
+    'ctrl_r': 'ctrl',
+    'alt_l': 'alt',
+    'alt_r': 'alt',
+    'shift_l': 'shift',
+    'shift_r': 'shift',
+    'cmd_l': 'cmd',
+    'cmd_r': 'cmd',
+    'win_l': 'win',
+    'win_r': 'win'
+}
+_KEY_CLEAN_RE = re.compile(r'^key\.|[<>]')
+# One key per match, separated by "+" with any spacing; a "+" in key position is the plus key
+_HOTKEY_KEY_RE = re.compile(r"\s*(\+|[^+]+?)\s*(?:\+|$)")
+
+# Settings window choices
+_MODEL_INFO = (
+    ("tiny", "Tiny (39 MB) - Fastest, least accurate"),
+    ("base", "Base (74 MB) - Good balance"),
+    ("small", "Small (244 MB) - Better accuracy"),
+    ("medium", "Medium (769 MB) - High accuracy"),
+    ("large", "Large (1550 MB) - Best accuracy")
+)
+_MODEL_INFO_DICT = dict(_MODEL_INFO)
+_MODEL_LABELS = tuple(label for _, label in _MODEL_INFO)
+_MODEL_LABEL_TO_KEY = {label: key for key, label in _MODEL_INFO}
+_LANGUAGES = (
+    "auto", "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko",
+    "zh", "ar", "hi", "tr", "pl", "nl", "sv", "da", "no", "fi"
+)
+
+# CTkFont objects shared by widgets that use the same size/weight
+_FONT_CACHE = {}
+
+def _font(size, weight=None):
+    """Return a cached CTkFont (creating one is a Tk round-trip)"""
+    font = _FONT_CACHE.get((size, weight))
+    if font is None:
+        font = _FONT_CACHE[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
 class ConfigManager:
     """Manages application configuration and settings"""
 
+    SAVE_DELAY = 0.5  # Seconds to wait for further changes before writing
+
     def __init__(self):
         self.config_file = Path.home() / ".voicetype_pro" / "config.json"
         self.config_file.parent.mkdir(exist_ok=True)
@@ -66,7 +149,12 @@ class ConfigManager:
             "whisper": {
                 "model_size": "base",
                 "language": "auto",
-                "task": "transcribe"
+                "task": "transcribe",
+                "backend": "auto",
+                "compute_type": "auto",
+                "batch_size": 16,
+                "min_speech_ms": 250,
+                "streaming": True
             },
             "ui": {
                 "theme": "dark",
@@ -81,39 +169,78 @@ class ConfigManager:
                 "confidence_threshold": 0.7
             }
         }
+        self._flat = {}
+        self._listeners = []
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        self._pending_keys = None  # Keys changed inside an open transaction()
         self.load_config()
 
     def load_config(self):
         """Load configuration from file or create default"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self.config = {**self.default_config, **loaded_config}
+                loaded_config = orjson.loads(self.config_file.read_bytes())
+                # Merge with defaults to ensure all keys exist
+                self.config = {**self.default_config, **loaded_config}
             else:
                 self.config = self.default_config.copy()
                 self.save_config()
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             self.config = self.default_config.copy()
+        self._rebuild_flat()
+
+    def _rebuild_flat(self):
+        """Rebuild the dot-notation lookup table from the nested config"""
+        flat = {}
+
+        def flatten(prefix, node):
+            for key, value in node.items():
+                path = f"{prefix}.{key}" if prefix else key
+                flat[path] = value
+                if isinstance(value, dict):
+                    flatten(path, value)
+
+        flatten("", self.config)
+        self._flat = flat
+
+    def add_listener(self, callback):
+        """Register callback(key_path) to be notified after each set()"""
+        self._listeners.append(callback)
 
     def save_config(self):
-        """Save current configuration to file"""
+        """Save current configuration to file (atomic replace)"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            tmp_file = self.config_file.with_suffix('.tmp')
+            tmp_file.write_bytes(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
 
+    def schedule_save(self):
+        """Coalesce rapid set() calls into a single write"""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write any pending changes now"""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+        self.save_config()
+
     def get(self, key_path, default=None):
         """Get config value using dot notation (e.g., 'audio.sample_rate')"""
-        keys = key_path.split('.')
-        value = self.config
-        for key in keys:
-            value = value.get(key, default)
-            if value is None:
-                return default
+        value = self._flat.get(key_path)
+        if value is None:
+            return default
         return value
 
     def set(self, key_path, value):
@@ -123,46 +250,94 @@ class ConfigManager:
         for key in keys[:-1]:
             config = config.setdefault(key, {})
         config[keys[-1]] = value
+
+        if self._pending_keys is not None:
+            # Inside transaction(): lookup rebuild, write and notify happen once on exit
+            self._pending_keys.append(key_path)
+            return
+
+        self._rebuild_flat()
+        self.schedule_save()
+        self._notify(key_path)
+
+    @contextmanager
+    def transaction(self):
+        """Batch several set() calls into one write; roll back if the block raises"""
+        snapshot = copy.deepcopy(self.config)
+        self._pending_keys = []
+        try:
+            yield self
+        except Exception:
+            self.config = snapshot
+            self._pending_keys = None
+            raise
+
+        changed, self._pending_keys = self._pending_keys, None
+        self._rebuild_flat()
         self.save_config()
+        for key_path in changed:
+            self._notify(key_path)
+
+    def _notify(self, key_path):
+        """Call registered listeners for a changed key"""
+        for callback in self._listeners:
+            try:
+                callback(key_path)
+            except Exception as e:
+                logger.error(f"Error in config listener: {e}")
 
 class AudioRecorder:
     """Handles audio recording and processing"""
 
+    INITIAL_BUFFER_SECONDS = 30
+    WHISPER_SAMPLE_RATE = 16000
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.is_recording = False
-        self.audio_queue = queue.Queue()
         self.sample_rate = self.config.get('audio.sample_rate', 16000)
+        self.capture_rate = self.WHISPER_SAMPLE_RATE
         self.channels = self.config.get('audio.channels', 1)
         self.chunk_size = self.config.get('audio.chunk_size', 1024)
 
-        # Initialize PyAudio
-        self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.audio_data = []
+        self._stream_lock = threading.Lock()  # Serializes opening a stream with PortAudio re-init
+        self._device_cache = None
+        # Capture buffer; the callback copies into it at _wpos
+        self._buf = None
+        self._wpos = 0
 
     def start_recording(self):
         """Start audio recording"""
+        with self._stream_lock:
+            self._start_stream()
+
+    def _start_stream(self):
+        """Open and start the input stream (caller holds _stream_lock)"""
         if self.is_recording:
             return
 
         try:
+            device = self.config.get('audio.device_index')
+            self.capture_rate = self._select_capture_rate(device)
+
+            # Fresh buffer per recording so the returned view stays valid
+            self._buf = np.empty(int(self.capture_rate * self.INITIAL_BUFFER_SECONDS), dtype=np.int16)
+            self._wpos = 0
             self.is_recording = True
-            self.audio_data = []
 
             # Configure audio stream
-            self.stream = self.audio.open(
-                format=pyaudio.paFloat32,
+            self.stream = sd.InputStream(
+                samplerate=self.capture_rate,
                 channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size,
-                input_device_index=self.config.get('audio.device_index'),
-                stream_callback=self._audio_callback
+                dtype='int16',
+                blocksize=self.chunk_size,
+                device=device,
+                callback=self._audio_callback
             )
 
-            self.stream.start_stream()
-            logger.info("Recording started")
+            self.stream.start()
+            logger.info(f"Recording started at {self.capture_rate} Hz")
 
         except Exception as e:
             logger.error(f"Error starting recording: {e}")
@@ -177,13 +352,14 @@ class AudioRecorder:
             self.is_recording = False
 
             if self.stream:
-                self.stream.stop_stream()
+                self.stream.stop()
                 self.stream.close()
                 self.stream = None
 
-            if self.audio_data:
-                # Convert to numpy array
-                audio_array = np.concatenate(self.audio_data)
+            if self._wpos:
+                audio_array = self._to_float32(self._buf[:self._wpos])
+                if self.capture_rate != self.WHISPER_SAMPLE_RATE:
+                    audio_array = self._resample(audio_array, self.capture_rate)
                 logger.info(f"Recording stopped, captured {len(audio_array)} samples")
                 return audio_array
 
@@ -192,76 +368,268 @@ class AudioRecorder:
 
         return None
 
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for audio stream"""
-        if self.is_recording:
-            audio_chunk = np.frombuffer(in_data, dtype=np.float32)
-            self.audio_data.append(audio_chunk)
-        return (in_data, pyaudio.paContinue)
+    def recorded_seconds(self):
+        """Length of the current recording in seconds"""
+        return self._wpos / self.capture_rate
+
+    def get_audio(self, start, end):
+        """Return 16 kHz float32 audio between two offsets (seconds) of the current recording"""
+        # Read _wpos before _buf: a grown buffer always holds everything up to the old _wpos
+        wpos = self._wpos
+        buf = self._buf
+        chunk = buf[int(start * self.capture_rate):min(int(end * self.capture_rate), wpos)]
+        audio_array = self._to_float32(chunk)
+        if self.capture_rate != self.WHISPER_SAMPLE_RATE:
+            audio_array = self._resample(audio_array, self.capture_rate)
+        return audio_array
+
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Callback for audio stream (runs on the PortAudio thread)"""
+        if not self.is_recording:
+            return
+
+        wpos = self._wpos
+        end = wpos + frames
+        if end > len(self._buf):
+            # Grow geometrically so long recordings stay amortized O(n)
+            grown = np.empty(max(end, len(self._buf) * 2), dtype=np.int16)
+            grown[:wpos] = self._buf[:wpos]
+            self._buf = grown
+        self._buf[wpos:end] = indata[:, 0]
+        self._wpos = end
+
+    def _select_capture_rate(self, device):
+        """Capture at Whisper's 16 kHz when the device supports it, else its native rate"""
+        try:
+            sd.check_input_settings(device=device, channels=self.channels,
+                                    dtype='int16', samplerate=self.WHISPER_SAMPLE_RATE)
+            return self.WHISPER_SAMPLE_RATE
+        except Exception:
+            rate = int(sd.query_devices(device, 'input')['default_samplerate'])
+            logger.info(f"Device does not support 16 kHz, capturing at {rate} Hz")
+            return rate
+
+    def _resample(self, audio, rate):
+        """Resample to 16 kHz once with a polyphase FIR filter"""
+        g = gcd(self.WHISPER_SAMPLE_RATE, rate)
+        resampled = resample_poly(audio, self.WHISPER_SAMPLE_RATE // g, rate // g, window=('kaiser', 5.0))
+        return resampled.astype(np.float32, copy=False)
+
+    @staticmethod
+    def _to_float32(samples):
+        """Convert int16 samples to peak-normalized float32 in one scaling pass"""
+        peak = max(int(samples.max()), -int(samples.min()), 1)
+        audio = samples.astype(np.float32)
+        audio *= np.float32(1.0 / peak)
+        return audio
 
     def get_audio_devices(self):
-        """Get list of available audio input devices"""
+        """Get list of available audio input devices (cached after the first scan)"""
+        if self._device_cache is not None:
+            return self._device_cache
+
         devices = []
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            if info['maxInputChannels'] > 0:
+        for i, info in enumerate(sd.query_devices()):
+            if info['max_input_channels'] > 0:
                 devices.append({
                     'index': i,
                     'name': info['name'],
-                    'channels': info['maxInputChannels']
+                    'channels': info['max_input_channels']
                 })
+        self._device_cache = devices
         return devices
 
+    def invalidate_device_cache(self):
+        """Forget the cached device list; the next lookup rescans"""
+        self._device_cache = None
+
+    def refresh_devices(self):
+        """Drop the cached device list and rescan, picking up newly plugged devices"""
+        with self._stream_lock:
+            # PortAudio only enumerates at initialization; it cannot be restarted under an open stream
+            if self.stream is None:
+                sd._terminate()
+                sd._initialize()
+            self.invalidate_device_cache()
+            return self.get_audio_devices()
+
     def cleanup(self):
         """Clean up audio resources"""
         if self.stream:
             self.stream.close()
-        self.audio.terminate()
+            self.stream = None
 
 class WhisperTranscriber:
     """Handles speech-to-text transcription using Whisper"""
 
+    # Quantized ggml models used by the whisper.cpp backend
+    GGML_MODELS = {
+        "tiny": "tiny-q5_1",
+        "base": "base-q5_1",
+        "small": "small-q5_1",
+        "medium": "medium-q5_0",
+        "large": "large-v3-q5_0"
+    }
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.model = None
+        self.batched = None
+        self.backend = self.config.get('whisper.backend', 'auto')
         self.model_size = self.config.get('whisper.model_size', 'base')
         self.language = self.config.get('whisper.language', 'auto')
         self.task = self.config.get('whisper.task', 'transcribe')
-        self.load_model()
+        self.batch_size = self.config.get('whisper.batch_size', 16)
+        self.min_speech_samples = int(self.config.get('whisper.min_speech_ms', 250)
+                                      * AudioRecorder.WHISPER_SAMPLE_RATE / 1000)
+        # Same options the batched pipeline would use, so its clips can be reused
+        self._vad_options = VadOptions(min_silence_duration_ms=500, max_speech_duration_s=30)
+        # Fillers are whole whitespace-delimited tokens ("uh-huh" is kept); each is replaced
+        # by a \x00 marker so the punctuation tidy-up below only touches removal sites
+        self._filler_re = re.compile(r"(?<!\S)(?:um|uh|er|ah|hmm)(?=[,.!?]?(?!\S))", re.IGNORECASE)
+        self._filler_sentence_re = re.compile(r"(?:^|(?<=[.!?]))\s*\x00[.!?]")  # Filler was the whole sentence
+        self._filler_end_re = re.compile(r",?\s*\x00([.!?])")  # Filler ended a sentence: keep the terminator
+        self._sentence_re = re.compile(r"(?<=[.!?])\s+")
+        # Streaming windows and final passes may overlap; backends are not all thread-safe
+        self._model_lock = threading.Lock()
+
+        # Load and warm the model in the background so the GUI starts immediately
+        self.ready = threading.Event()
+        threading.Thread(target=self._load_and_warm, daemon=True).start()
+
+    def _load_and_warm(self):
+        """Load the model and run one silent pass to initialize kernels"""
+        try:
+            self.load_model()
+            silence = np.zeros(16000, dtype=np.float32)
+            if self.backend == 'faster':
+                # Bypass the batched pipeline: its VAD would skip pure silence
+                segments, _ = self.model.transcribe(silence, beam_size=1)
+                list(segments)
+            else:
+                self._run_model(silence, 'en')
+            logger.info("Whisper model warmed up")
+        except Exception as e:
+            logger.error(f"Error preparing Whisper model: {e}")
+        finally:
+            self.ready.set()
 
     def load_model(self):
-        """Load Whisper model"""
+        """Load Whisper model for the configured backend (auto, faster, cpp or torch)"""
         try:
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
+            if self.backend == 'auto':
+                # faster-whisper (float16 on CUDA, int8 on CPU); whisper.cpp and torch are opt-in
+                self.backend = 'faster'
+
+            if self.backend == 'cpp':
+                self._load_cpp_model()
+            elif self.backend == 'torch':
+                self._load_torch_model()
+            else:
+                self._load_faster_model()
             logger.info("Whisper model loaded successfully")
         except Exception as e:
             logger.error(f"Error loading Whisper model: {e}")
             raise
 
-    def transcribe(self, audio_data):
-        """Transcribe audio data to text"""
+    def _load_faster_model(self):
+        """Load faster-whisper (CTranslate2, int8 on CPU / float16 on GPU)"""
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        compute_type = self.config.get('whisper.compute_type', 'auto')
+        if compute_type == 'auto':
+            compute_type = "float16" if device == "cuda" else "int8"
+
+        logger.info(f"Loading Whisper model: {self.model_size} (faster-whisper, {device}, {compute_type})")
+        self.model = WhisperModel(self.model_size, device=device, compute_type=compute_type)
+        self.batched = BatchedInferencePipeline(model=self.model)
+
+    def _load_cpp_model(self):
+        """Load a quantized ggml model with whisper.cpp (SIMD CPU kernels)"""
+        from pywhispercpp.model import Model as WhisperCppModel
+
+        model_name = self.GGML_MODELS.get(self.model_size, self.model_size)
+        n_threads = max(1, (os.cpu_count() or 2) // 2)
+        logger.info(f"Loading Whisper model: {model_name} (whisper.cpp, {n_threads} threads)")
+        # pywhispercpp downloads the ggml file on first use
+        self.model = WhisperCppModel(model_name, n_threads=n_threads)
+
+    def _load_torch_model(self):
+        """Load the reference PyTorch Whisper model"""
+        import whisper
+
+        logger.info(f"Loading Whisper model: {self.model_size} (openai-whisper)")
+        self.model = whisper.load_model(self.model_size)
+
+    def _run_segments(self, audio_data, language, clip_timestamps=None):
+        """Run the loaded backend and return (start, end, text) segments in seconds"""
+        with self._model_lock:
+            if self.backend == 'cpp':
+                segments = self.model.transcribe(
+                    audio_data,
+                    language=language or 'auto',
+                    translate=self.task == 'translate'
+                )
+                # whisper.cpp timestamps are in centiseconds
+                return [(seg.t0 / 100, seg.t1 / 100, seg.text) for seg in segments]
+
+            if self.backend == 'torch':
+                result = self.model.transcribe(audio_data, language=language, task=self.task, fp16=False)
+                return [(seg['start'], seg['end'], seg['text']) for seg in result['segments']]
+
+            # faster-whisper (CTranslate2 computes the log-mel features itself)
+            if clip_timestamps is not None:
+                # Speech regions already found by transcribe(); skip a second VAD pass
+                segments, info = self.batched.transcribe(
+                    audio_data,
+                    language=language,
+                    task=self.task,
+                    batch_size=self.batch_size,
+                    clip_timestamps=clip_timestamps
+                )
+                return [(seg.start, seg.end, seg.text) for seg in segments]
+
+            segments, info = self.batched.transcribe(
+                audio_data,
+                language=language,
+                task=self.task,
+                batch_size=self.batch_size,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500)
+            )
+            return [(seg.start, seg.end, seg.text) for seg in segments]
+
+    def _run_model(self, audio_data, language, clip_timestamps=None):
+        """Run the loaded backend and return the raw transcript"""
+        return "".join(text for _, _, text in self._run_segments(audio_data, language, clip_timestamps))
+
+    def transcribe_segments(self, audio_data):
+        """Transcribe a window of audio to raw (start, end, text) segments"""
+        self.ready.wait()
+        if self.model is None:
+            raise Exception("Whisper model not loaded")
+
+        language = None if self.language == 'auto' else self.language
+        return self._run_segments(self._prepare_audio(audio_data), language)
+
+    def transcribe(self, audio_data, prefix=""):
+        """Transcribe audio data to text, appended to already transcribed raw text"""
+        self.ready.wait()
         if self.model is None:
             raise Exception("Whisper model not loaded")
 
         try:
-            # Ensure audio is in the right format
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
+            audio_data = self._prepare_audio(audio_data)
 
-            # Normalize audio
-            audio_data = audio_data / np.max(np.abs(audio_data))
+            # Skip the model entirely when VAD finds (almost) no speech
+            speech = get_speech_timestamps(audio_data, self._vad_options)
+            if sum(ts['end'] - ts['start'] for ts in speech) < self.min_speech_samples:
+                logger.info("No speech detected by VAD, skipping transcription")
+                return self._post_process_text(prefix.strip())
 
-            # Transcribe
+            # Transcribe only the merged speech regions found above
             language = None if self.language == 'auto' else self.language
-            result = self.model.transcribe(
-                audio_data,
-                language=language,
-                task=self.task,
-                fp16=False
-            )
-
-            text = result['text'].strip()
+            clips = merge_segments(speech, self._vad_options)
+            text = (prefix + self._run_model(audio_data, language, clips)).strip()
 
             # Post-process text
             text = self._post_process_text(text)
@@ -273,34 +641,116 @@ class WhisperTranscriber:
             logger.error(f"Error during transcription: {e}")
             return None
 
+    def _prepare_audio(self, audio_data):
+        """Cast non-float32 audio to peak-normalized float32 in a single pass"""
+        if audio_data.dtype == np.float32:
+            # AudioRecorder already delivers normalized float32
+            return audio_data
+
+        # max/min instead of np.abs: no temporary array, no int16 overflow
+        peak = max(float(audio_data.max()), -float(audio_data.min())) if audio_data.size else 0.0
+        scale = np.float32(1.0 / peak) if peak > 1e-6 else np.float32(1.0)
+        out = np.empty(audio_data.shape, dtype=np.float32)
+        np.multiply(audio_data, scale, out=out, casting='unsafe')
+        return out
+
     def _post_process_text(self, text):
         """Post-process transcribed text"""
         if not text:
             return text
 
-        # Remove filler words if enabled
-        if self.config.get('behavior.remove_filler_words', True):
-            filler_words = ['um', 'uh', 'er', 'ah', 'hmm']
-            words = text.split()
-            words = [word for word in words if word.lower() not in filler_words]
-            text = ' '.join(words)
+        remove_fillers = self.config.get('behavior.remove_filler_words', True)
+        capitalize = self.config.get('behavior.capitalize_sentences', True)
+        punctuate = self.config.get('behavior.auto_punctuation', True)
+
+        # Remove filler words if enabled (single regex pass)
+        if remove_fillers:
+            text = self._filler_re.sub("\x00", text).replace("\x00,", "\x00")
+            text = self._filler_sentence_re.sub("", text)
+            text = self._filler_end_re.sub(r"\1", text)
+            text = " ".join(text.replace("\x00", "").split())
 
         # Capitalize sentences if enabled
-        if self.config.get('behavior.capitalize_sentences', True):
-            sentences = text.split('. ')
-            sentences = [s.strip().capitalize() for s in sentences if s.strip()]
-            text = '. '.join(sentences)
+        if capitalize:
+            sentences = self._sentence_re.split(text)
+            text = ' '.join([s.capitalize() for s in sentences if s])
 
         # Add automatic punctuation if enabled
-        if self.config.get('behavior.auto_punctuation', True):
+        if punctuate:
             if text and not text.endswith(('.', '!', '?')):
                 text += '.'
 
         return text
 
+class StreamingTranscription:
+    """Transcribes an in-progress recording in fixed windows while the user speaks"""
+
+    WINDOW_SECONDS = 30
+    OVERLAP_SECONDS = 3
+
+    def __init__(self, audio_recorder, transcriber):
+        self.audio_recorder = audio_recorder
+        self.transcriber = transcriber
+        self.committed = 0.0  # Seconds of the recording already transcribed
+        self.partial_text = ""
+        self._stop = threading.Event()
+        self._lock = threading.Lock()  # Held while a window is read from the recorder
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Transcribe each full window as soon as it has been recorded"""
+        while not self._stop.wait(0.5):
+            try:
+                if self.audio_recorder.recorded_seconds() - self.committed >= self.WINDOW_SECONDS:
+                    self._transcribe_window()
+            except Exception as e:
+                logger.error(f"Error during streaming transcription: {e}")
+                return
+
+    def _transcribe_window(self):
+        """Transcribe one window and commit the segments that cannot be cut off"""
+        with self._lock:
+            # Once stopped, the recorder may already hold the next recording
+            if self._stop.is_set():
+                return
+            audio = self.audio_recorder.get_audio(self.committed, self.committed + self.WINDOW_SECONDS)
+        window_end = len(audio) / AudioRecorder.WHISPER_SAMPLE_RATE
+        segments = self.transcriber.transcribe_segments(audio)
+
+        # The last segment may run into the window edge; leave it for the next window
+        if len(segments) > 1 and segments[-1][1] > window_end - self.OVERLAP_SECONDS:
+            segments = segments[:-1]
+
+        if segments:
+            self.partial_text += "".join(text for _, _, text in segments)
+            advance = segments[-1][1]
+        else:
+            advance = window_end - self.OVERLAP_SECONDS
+        self.committed += max(advance, 1.0)
+
+    def stop(self):
+        """Stop reading windows (call before the recorder is stopped)"""
+        with self._lock:
+            self._stop.set()
+
+    def cancel(self):
+        """Stop transcribing windows"""
+        self._stop.set()
+        self._thread.join()
+
+    def finish(self, audio_data):
+        """Transcribe the remaining tail and return the full text"""
+        self.cancel()
+        tail = audio_data[int(self.committed * AudioRecorder.WHISPER_SAMPLE_RATE):]
+        return self.transcriber.transcribe(tail, prefix=self.partial_text)
+
+
 class HotkeyManager:
     """Manages global hotkeys and input handling"""
 
+    MODIFIER_KEYS = frozenset({'ctrl', 'alt', 'shift', 'cmd', 'win'})
+
     def __init__(self, config_manager, callback_handler):
         self.config = config_manager
         self.callback_handler = callback_handler
@@ -309,8 +759,23 @@ class HotkeyManager:
         self.push_to_talk_active = False
         self.toggle_mode_active = False
         self.last_toggle_time = 0
+        self.refresh_hotkeys()
+        self.config.add_listener(self._on_config_changed)
         self.start_listening()
 
+    def refresh_hotkeys(self):
+        """Snapshot normalized hotkey combinations from config"""
+        self._ptt_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', []))
+        self._toggle_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', []))
+        # When every hotkey needs a modifier, plain typing can never trigger one
+        self._needs_modifier = all(keys & self.MODIFIER_KEYS
+                                   for keys in (self._ptt_keys, self._toggle_keys) if keys)
+
+    def _on_config_changed(self, key_path):
+        """Refresh cached hotkeys when they change in config"""
+        if key_path.startswith('hotkeys'):
+            self.refresh_hotkeys()
+
     def start_listening(self):
         """Start listening for global hotkeys"""
         try:
@@ -335,22 +800,23 @@ class HotkeyManager:
             key_name = self._get_key_name(key)
             if key_name:
                 self.current_keys.add(key_name)
-                logger.debug(f"Key pressed: {key_name}, Current keys: {self.current_keys}")
 
-                # Check for push-to-talk
-                ptt_keys = set([k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', [])])
-                current_keys_normalized = set([k.lower().strip() for k in self.current_keys])
+                # Plain typing: no modifier held, so no hotkey can match
+                if self._needs_modifier and self.current_keys.isdisjoint(self.MODIFIER_KEYS):
+                    return
 
-                if ptt_keys and ptt_keys.issubset(current_keys_normalized) and not self.push_to_talk_active:
+                logger.debug(f"Key pressed: {key_name}, Current keys: {self.current_keys}")
+
+                # Check for push-to-talk (key names are already normalized by _get_key_name)
+                if self._ptt_keys and self._ptt_keys <= self.current_keys and not self.push_to_talk_active:
                     logger.info("Push-to-talk activated")
                     self.push_to_talk_active = True
                     self.callback_handler.on_push_to_talk_start()
 
                 # Check for toggle recording (prevent multiple triggers)
-                toggle_keys = set([k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', [])])
                 current_time = time.time()
 
-                if (toggle_keys and toggle_keys.issubset(current_keys_normalized) and
+                if (self._toggle_keys and self._toggle_keys <= self.current_keys and
                     not self.toggle_mode_active and
                     current_time - self.last_toggle_time > 0.5):  # 500ms debounce
 
@@ -371,17 +837,13 @@ class HotkeyManager:
                 logger.debug(f"Key released: {key_name}, Current keys: {self.current_keys}")
 
                 # Check if push-to-talk should be released
-                ptt_keys = set([k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', [])])
-                current_keys_normalized = set([k.lower().strip() for k in self.current_keys])
-
-                if self.push_to_talk_active and not ptt_keys.issubset(current_keys_normalized):
+                if self.push_to_talk_active and not self._ptt_keys <= self.current_keys:
                     logger.info("Push-to-talk deactivated")
                     self.push_to_talk_active = False
                     self.callback_handler.on_push_to_talk_end()
 
                 # Reset toggle processing when keys are released
-                toggle_keys = set([k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', [])])
-                if not toggle_keys.issubset(current_keys_normalized):
+                if not self._toggle_keys <= self.current_keys:
                     self.toggle_mode_active = False
 
         except Exception as e:
@@ -390,28 +852,16 @@ class HotkeyManager:
     def _get_key_name(self, key):
         """Convert key object to string representation"""
         try:
-            if hasattr(key, 'char') and key.char and key.char.isprintable():
-                return key.char.lower()
-            elif hasattr(key, 'name'):
-                # Map special key names to standard format
-                name_mapping = {
-                    'ctrl_l': 'ctrl',
-                    'ctrl_r': 'ctrl',
-                    'alt_l': 'alt',
-                    'alt_r': 'alt',
-                    'shift_l': 'shift',
-                    'shift_r': 'shift',
-                    'cmd': 'cmd',
-                    'cmd_l': 'cmd',
-                    'cmd_r': 'cmd',
-                    'win': 'win',
-                    'win_l': 'win',
-                    'win_r': 'win'
-                }
+            try:
+                char = key.char
+            except AttributeError:
+                # Special key (pynput Key enum): map to standard format
                 key_name = key.name.lower()
-                return name_mapping.get(key_name, key_name)
-            else:
-                return str(key).lower().replace('key.', '').replace('<', '').replace('>', '')
+                return _KEY_NAME_MAP.get(key_name, key_name)
+
+            if char and char.isprintable():
+                return char.lower()
+            return _KEY_CLEAN_RE.sub('', str(key).lower())
         except Exception as e:
             logger.error(f"Error getting key name: {e}")
             return None
@@ -426,31 +876,56 @@ class TextInjector:
     def paste_text(self, text):
         """Paste text at current cursor position"""
         try:
-            # Store current clipboard content
-            import pyperclip
-            original_clipboard = pyperclip.paste()
-
-            # Copy new text to clipboard
-            pyperclip.copy(text)
-
-            # Small delay to ensure clipboard is updated
-            time.sleep(0.1)
+            # Clipboard calls are synchronous, so no settle delay is needed
+            original_clipboard = self._get_clipboard_text()
+            self._set_clipboard_text(text)
+            sequence = win32clipboard.GetClipboardSequenceNumber()
 
             # Paste using Ctrl+V
-            with self.controller.pressed(Key.ctrl):
-                self.controller.press('v')
-                self.controller.release('v')
-
-            # Restore original clipboard after a delay
-            threading.Timer(0.01, lambda: pyperclip.copy(original_clipboard)).start()
+            win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)
+            win32api.keybd_event(ord('V'), 0, 0, 0)
+            win32api.keybd_event(ord('V'), 0, win32con.KEYEVENTF_KEYUP, 0)
+            win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
 
             logger.info(f"Text pasted: {text[:50]}...")
 
+            # Restore the original clipboard once the target window has had a moment
+            # to process the paste, off the transcription worker
+            if original_clipboard is not None:
+                threading.Timer(0.1, self._restore_clipboard, args=(original_clipboard, sequence)).start()
+
         except Exception as e:
             logger.error(f"Error pasting text: {e}")
             # Fallback: type the text directly
             self._type_text(text)
 
+    def _restore_clipboard(self, original_clipboard, sequence):
+        """Put the original text back unless something else was copied meanwhile"""
+        try:
+            if win32clipboard.GetClipboardSequenceNumber() == sequence:
+                self._set_clipboard_text(original_clipboard)
+        except Exception as e:
+            logger.error(f"Error restoring clipboard: {e}")
+
+    def _get_clipboard_text(self):
+        """Read unicode text from the clipboard, or None if there is none"""
+        win32clipboard.OpenClipboard()
+        try:
+            if win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+                return win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+            return None
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def _set_clipboard_text(self, text):
+        """Replace clipboard contents with unicode text"""
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
     def _type_text(self, text):
         """Fallback method to type text directly"""
         try:
@@ -462,6 +937,8 @@ class TextInjector:
 class VoiceTypeProApp:
     """Main application class"""
 
+    ROOT_BINDTAG = "VoiceTypeRoot"
+
     def __init__(self):
         self.config = ConfigManager()
         self.audio_recorder = AudioRecorder(self.config)
@@ -477,25 +954,41 @@ class VoiceTypeProApp:
         self.root = None
         self.tray_icon = None
 
+        # Single transcription worker fed by a queue
+        self.transcription_queue = queue.Queue()
+        self.streaming = None
+        threading.Thread(target=self._transcription_worker, daemon=True).start()
+
         # Initialize GUI
         self.setup_gui()
 
         # Initialize system tray
         self.setup_tray()
 
+        # Show model loading state until the transcriber is ready
+        self.update_status("Loading model...", "yellow")
+        self.root.after(200, self._check_model_ready)
+
+    def _check_model_ready(self):
+        """Poll the background model load from the Tk loop"""
+        if not self.transcriber.ready.is_set():
+            self.root.after(200, self._check_model_ready)
+        elif self.transcriber.model is None:
+            self.update_status("Failed to load model", "red")
+        elif not self.is_recording:
+            self.update_status("Ready")
+
     def on_window_show(self, event=None):
         """Handle main window being shown"""
-        if event and event.widget == self.root:
-            # Hide popup when main window is shown
-            if self.background_mode and self.background_popup.is_visible:
-                self.background_popup.hide_popup()
+        # Hide popup when main window is shown
+        if self.background_mode and self.background_popup.is_visible:
+            self.background_popup.hide_popup()
 
     def on_window_hide(self, event=None):
         """Handle main window being hidden"""
-        if event and event.widget == self.root:
-            # Show popup when main window is hidden (only in background mode)
-            if self.background_mode and not self.background_popup.is_visible:
-                self.background_popup.show_popup()
+        # Show popup when main window is hidden (only in background mode)
+        if self.background_mode and not self.background_popup.is_visible:
+            self.background_popup.show_popup()
 
     def setup_gui(self):
         """Setup the main GUI window"""
@@ -579,10 +1072,11 @@ class VoiceTypeProApp:
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # Handle window events for popup management
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.bind("<Map>", self.on_window_show)      # Window shown
-        self.root.bind("<Unmap>", self.on_window_hide)    # Window hidden
+        # Handle window events for popup management. Bound on a tag that only the
+        # root carries, so Map/Unmap from child widgets never reach the handlers.
+        self.root.bindtags((self.ROOT_BINDTAG,) + self.root.bindtags())
+        self.root.bind_class(self.ROOT_BINDTAG, "<Map>", self.on_window_show)      # Window shown
+        self.root.bind_class(self.ROOT_BINDTAG, "<Unmap>", self.on_window_hide)    # Window hidden
 
     def setup_transcription_log(self, parent):
         """Setup the transcription log display"""
@@ -669,6 +1163,7 @@ class VoiceTypeProApp:
             self.audio_recorder.stop_recording()
         self.audio_recorder.cleanup()
         self.hotkey_manager.stop_listening()
+        self.config.flush()
 
     def update_status(self, message, color="white"):
         """Update status display"""
@@ -719,6 +1214,10 @@ class VoiceTypeProApp:
             self.audio_recorder.start_recording()
             self.is_recording = True
 
+            # Transcribe long dictation in windows while still recording
+            if self.config.get('whisper.streaming', True) and self.audio_recorder.is_recording:
+                self.streaming = StreamingTranscription(self.audio_recorder, self.transcriber)
+
             self.update_status("Recording...", "green")
             self.update_recording_indicator(True)
 
@@ -736,6 +1235,10 @@ class VoiceTypeProApp:
     def stop_recording_and_transcribe(self):
         """Stop recording and transcribe audio"""
         try:
+            # Detach streaming first so it never reads from the next recording
+            streaming, self.streaming = self.streaming, None
+            if streaming:
+                streaming.stop()
             audio_data = self.audio_recorder.stop_recording()
             self.is_recording = False
             self.is_toggle_mode = False
@@ -751,13 +1254,11 @@ class VoiceTypeProApp:
                 self.record_button.configure(text="Start Recording")
 
             if audio_data is not None and len(audio_data) > 0:
-                # Transcribe in separate thread
-                threading.Thread(
-                    target=self.transcribe_and_paste,
-                    args=(audio_data,),
-                    daemon=True
-                ).start()
+                # Hand off to the transcription worker
+                self.transcription_queue.put((audio_data, streaming))
             else:
+                if streaming:
+                    streaming.cancel()
                 self.update_status("No audio captured", "orange")
                 # Update popup status too
                 if self.background_mode:
@@ -769,37 +1270,57 @@ class VoiceTypeProApp:
             if self.background_mode:
                 self.background_popup.update_status("Error", recording=False)
 
-    def transcribe_and_paste(self, audio_data):
-        """Transcribe audio and paste text"""
+    def _transcription_worker(self):
+        """Transcribe queued recordings in order, each as soon as it is queued"""
+        while True:
+            audio_data, streaming = self.transcription_queue.get()
+            self.transcribe_and_paste(audio_data, streaming)
+
+    def transcribe_and_paste(self, audio_data, streaming=None):
+        """Transcribe audio and paste text (runs on the transcription worker)"""
         try:
-            # Transcribe
-            text = self.transcriber.transcribe(audio_data)
+            # Transcribe (only the untranscribed tail when windows were streamed)
+            if streaming:
+                text = streaming.finish(audio_data)
+            else:
+                text = self.transcriber.transcribe(audio_data)
 
             if text:
                 # Add to log
-                self.add_transcription_to_log(text)
+                self._run_on_ui(self.add_transcription_to_log, text)
 
                 # Paste text
                 self.text_injector.paste_text(text)
 
-                self.update_status("Text pasted successfully", "green")
-                if self.background_mode:
-                    self.background_popup.update_status("Pasted!", recording=False)
+                self._show_result("Text pasted successfully", "green", "Pasted!")
             else:
-                self.update_status("No speech detected", "orange")
-                if self.background_mode:
-                    self.background_popup.update_status("No speech", recording=False)
+                self._show_result("No speech detected", "orange", "No speech")
 
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
-            self.update_status("Transcription error", "red")
+            self._show_result("Transcription error", "red", "Error")
+
+        # Reset status after delay on the Tk event loop
+        self._run_on_ui(self.root.after, 2250, self._show_ready)
+
+    def _run_on_ui(self, callback, *args):
+        """Schedule a GUI call on the Tk thread (widgets are not thread-safe)"""
+        self.root.after(0, callback, *args)
+
+    def _show_result(self, message, color, popup_message):
+        """Show a transcription result in the main window and popup"""
+        def show():
+            self.update_status(message, color)
             if self.background_mode:
-                self.background_popup.update_status("Error", recording=False)
+                self.background_popup.update_status(popup_message, recording=False)
+
+        self._run_on_ui(show)
 
-        # Reset status after delay
-        threading.Timer(2.25, lambda: self.update_status("Ready")).start()
+    def _show_ready(self):
+        """Reset main window and popup status to Ready"""
+        self.update_status("Ready")
         if self.background_mode:
-            threading.Timer(2.25, lambda: self.background_popup.update_status("Ready", recording=False)).start()
+            self.background_popup.update_status("Ready", recording=False)
 
     def open_settings(self, icon=None, item=None):
         """Open settings window"""
@@ -855,20 +1376,26 @@ class SettingsWindow:
         self.window.geometry("600x500")
         self.window.resizable(True, True)
 
-        # Make window modal
+        # Stay above the main window; the modal grab is taken once the window is mapped
         self.window.transient(self.parent_app.root)
-        self.window.grab_set()
 
         # Main container with tabs
-        self.notebook = ctk.CTkTabview(self.window)
+        self.notebook = ctk.CTkTabview(self.window, command=self.on_tab_changed)
         self.notebook.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Create tabs
-        self.setup_hotkeys_tab()
-        self.setup_audio_tab()
-        self.setup_whisper_tab()
-        self.setup_behavior_tab()
-        self.setup_ui_tab()
+        # Create empty tabs; each body is built the first time it is selected
+        self._tab_builders = {
+            "Hotkeys": self.setup_hotkeys_tab,
+            "Audio": self.setup_audio_tab,
+            "Transcription": self.setup_whisper_tab,
+            "Behavior": self.setup_behavior_tab,
+            "Interface": self.setup_ui_tab
+        }
+        self._built_tabs = set()
+        for name in self._tab_builders:
+            self.notebook.add(name)
+        self.notebook.set("Hotkeys")
+        self.build_tab("Hotkeys")
 
         # Buttons
         button_frame = ctk.CTkFrame(self.window)
@@ -888,9 +1415,27 @@ class SettingsWindow:
         )
         cancel_button.pack(side="right", pady=10)
 
+        # Make window modal once it is actually on screen
+        self.window.bind("<Map>", self.on_window_map, add="+")
+
+    def on_window_map(self, event):
+        """Grab input when the settings window itself (not a child widget) is mapped"""
+        if event.widget is self.window:
+            self.window.grab_set()
+
+    def on_tab_changed(self):
+        """Build the selected tab on first view"""
+        self.build_tab(self.notebook.get())
+
+    def build_tab(self, name):
+        """Build a tab's widgets if they do not exist yet"""
+        if name not in self._built_tabs:
+            self._built_tabs.add(name)
+            self._tab_builders[name]()
+
     def setup_hotkeys_tab(self):
         """Setup hotkeys configuration tab"""
-        tab = self.notebook.add("Hotkeys")
+        tab = self.notebook.tab("Hotkeys")
 
         # Push-to-talk hotkey
         ptt_frame = ctk.CTkFrame(tab)
@@ -917,7 +1462,7 @@ class SettingsWindow:
 
     def setup_audio_tab(self):
         """Setup audio configuration tab"""
-        tab = self.notebook.add("Audio")
+        tab = self.notebook.tab("Audio")
 
         # Audio device selection
         device_frame = ctk.CTkFrame(tab)
@@ -925,13 +1470,18 @@ class SettingsWindow:
 
         ctk.CTkLabel(device_frame, text="Audio Input Device:").pack(anchor="w", padx=10, pady=5)
 
-        # Get available audio devices
-        devices = self.parent_app.audio_recorder.get_audio_devices()
-        device_names = [f"{d['name']} ({d['channels']} ch)" for d in devices]
-
-        self.device_combo = ctk.CTkComboBox(device_frame, values=device_names)
+        # Devices are enumerated in the background; PortAudio scans can be slow
+        self.device_combo = ctk.CTkComboBox(device_frame, values=["Loading devices..."])
         self.device_combo.pack(fill="x", padx=10, pady=5)
 
+        rescan_button = ctk.CTkButton(
+            device_frame,
+            text="Rescan Devices",
+            command=lambda: self.load_audio_devices(refresh=True)
+        )
+        rescan_button.pack(anchor="w", padx=10, pady=5)
+        self.load_audio_devices()
+
         # Sample rate
         rate_frame = ctk.CTkFrame(tab)
         rate_frame.pack(fill="x", padx=10, pady=10)
@@ -956,9 +1506,37 @@ class SettingsWindow:
         self.auto_gain = ctk.CTkCheckBox(quality_frame, text="Automatic Gain Control")
         self.auto_gain.pack(anchor="w", padx=10, pady=2)
 
+    def load_audio_devices(self, refresh=False):
+        """Enumerate audio input devices off the GUI thread"""
+        recorder = self.parent_app.audio_recorder
+
+        def worker():
+            try:
+                devices = recorder.refresh_devices() if refresh else recorder.get_audio_devices()
+                self.window.after(0, self.populate_audio_devices, devices)
+            except Exception as e:
+                logger.error(f"Error enumerating audio devices: {e}")
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def populate_audio_devices(self, devices):
+        """Fill the device combo box with enumerated devices"""
+        if not self.window.winfo_exists():
+            return
+        device_names = [f"{d['name']} ({d['channels']} ch)" for d in devices]
+        self.device_combo.configure(values=device_names)
+
+        # Keep the configured device (or the current choice) selected across rescans
+        saved_index = self.config.get('audio.device_index')
+        selected = next((name for name, d in zip(device_names, devices) if d['index'] == saved_index), None)
+        if selected is None:
+            current = self.device_combo.get()
+            selected = current if current in device_names else (device_names[0] if device_names else "")
+        self.device_combo.set(selected)
+
     def setup_whisper_tab(self):
         """Setup Whisper model configuration tab"""
-        tab = self.notebook.add("Transcription")
+        tab = self.notebook.tab("Transcription")
 
         # Model size selection
         model_frame = ctk.CTkFrame(tab)
@@ -966,23 +1544,15 @@ class SettingsWindow:
 
         ctk.CTkLabel(model_frame, text="Whisper Model Size:").pack(anchor="w", padx=10, pady=5)
 
-        model_info = {
-            "tiny": "Tiny (39 MB) - Fastest, least accurate",
-            "base": "Base (74 MB) - Good balance",
-            "small": "Small (244 MB) - Better accuracy",
-            "medium": "Medium (769 MB) - High accuracy",
-            "large": "Large (1550 MB) - Best accuracy"
-        }
-
         self.model_combo = ctk.CTkComboBox(
             model_frame,
-            values=list(model_info.values())
+            values=list(_MODEL_LABELS)
         )
         self.model_combo.pack(fill="x", padx=10, pady=5)
 
-        current_model = self.config.get('whisper.model_size', 'base')
-        if current_model in model_info:
-            self.model_combo.set(model_info[current_model])
+        label = _MODEL_INFO_DICT.get(self.config.get('whisper.model_size', 'base'))
+        if label is not None:
+            self.model_combo.set(label)
 
         # Language selection
         lang_frame = ctk.CTkFrame(tab)
@@ -990,12 +1560,7 @@ class SettingsWindow:
 
         ctk.CTkLabel(lang_frame, text="Language:").pack(anchor="w", padx=10, pady=5)
 
-        languages = [
-            "auto", "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko",
-            "zh", "ar", "hi", "tr", "pl", "nl", "sv", "da", "no", "fi"
-        ]
-
-        self.language_combo = ctk.CTkComboBox(lang_frame, values=languages)
+        self.language_combo = ctk.CTkComboBox(lang_frame, values=list(_LANGUAGES))
         self.language_combo.pack(fill="x", padx=10, pady=5)
         self.language_combo.set(self.config.get('whisper.language', 'auto'))
 
@@ -1010,7 +1575,7 @@ class SettingsWindow:
 
     def setup_behavior_tab(self):
         """Setup behavior configuration tab"""
-        tab = self.notebook.add("Behavior")
+        tab = self.notebook.tab("Behavior")
 
         # Text processing options
         processing_frame = ctk.CTkFrame(tab)
@@ -1057,15 +1622,23 @@ class SettingsWindow:
         self.confidence_slider.pack(fill="x", padx=10, pady=5)
         self.confidence_slider.set(self.config.get('behavior.confidence_threshold', 0.7))
 
-        self.confidence_label = ctk.CTkLabel(confidence_frame, text="0.7")
+        # Label follows a StringVar so slider updates skip a full configure()
+        self._conf_var = tk.StringVar(master=self.window, value=f"{self.confidence_slider.get():.1f}")
+        self._last_label_upd = 0.0
+        self.confidence_label = ctk.CTkLabel(confidence_frame, textvariable=self._conf_var)
         self.confidence_label.pack(padx=10, pady=2)
 
-        # Update label when slider changes
+        # Update label when slider changes (throttled), and always on release
         self.confidence_slider.configure(command=self.update_confidence_label)
+        self.confidence_slider.bind(
+            "<ButtonRelease-1>",
+            lambda e: self._conf_var.set(f"{self.confidence_slider.get():.1f}"),
+            add="+"
+        )
 
     def setup_ui_tab(self):
         """Setup UI configuration tab"""
-        tab = self.notebook.add("Interface")
+        tab = self.notebook.tab("Interface")
 
         # Theme selection
         theme_frame = ctk.CTkFrame(tab)
@@ -1111,53 +1684,62 @@ class SettingsWindow:
             self.auto_start.select()
 
     def update_confidence_label(self, value):
-        """Update confidence threshold label"""
-        self.confidence_label.configure(text=f"{value:.1f}")
+        """Update confidence threshold label (at most every 50 ms while dragging)"""
+        now = time.monotonic()
+        if now - self._last_label_upd < 0.05:
+            return
+        self._last_label_upd = now
+        self._conf_var.set(f"{value:.1f}")
 
     def save_settings(self):
         """Save all settings"""
         try:
-            # Hotkeys
-            ptt_keys = self.ptt_entry.get().split(" + ")
-            toggle_keys = self.toggle_entry.get().split(" + ")
-
-            self.config.set('hotkeys.push_to_talk', [k.strip().lower() for k in ptt_keys if k.strip()])
-            self.config.set('hotkeys.toggle_recording', [k.strip().lower() for k in toggle_keys if k.strip()])
-
-            # Audio
-            self.config.set('audio.sample_rate', int(self.sample_rate_combo.get()))
-
-            # Whisper
-            model_mapping = {
-                "Tiny (39 MB) - Fastest, least accurate": "tiny",
-                "Base (74 MB) - Good balance": "base",
-                "Small (244 MB) - Better accuracy": "small",
-                "Medium (769 MB) - High accuracy": "medium",
-                "Large (1550 MB) - Best accuracy": "large"
-            }
-
-            selected_model = self.model_combo.get()
-            if selected_model in model_mapping:
-                self.config.set('whisper.model_size', model_mapping[selected_model])
-
-            self.config.set('whisper.language', self.language_combo.get())
-            self.config.set('whisper.task', self.task_combo.get())
-
-            # Behavior
-            self.config.set('behavior.auto_punctuation', bool(self.auto_punctuation.get()))
-            self.config.set('behavior.capitalize_sentences', bool(self.capitalize_sentences.get()))
-            self.config.set('behavior.remove_filler_words', bool(self.remove_filler_words.get()))
-            self.config.set('behavior.confidence_threshold', self.confidence_slider.get())
-
-            # UI
-            self.config.set('ui.theme', self.theme_combo.get())
-            self.config.set('ui.minimize_to_tray', bool(self.minimize_to_tray.get()))
-            self.config.set('ui.show_notifications', bool(self.show_notifications.get()))
-            # self.config.set('ui.auto_start', bool(self.auto_start.get()))
-
-            # Apply theme change
-            if self.theme_combo.get() != self.config.get('ui.theme'):
-                ctk.set_appearance_mode(self.theme_combo.get())
+            # Only tabs the user has opened have widgets to read from
+            built = self._built_tabs
+            old_theme = self.config.get('ui.theme', 'dark')
+
+            # Write everything once, after all values are collected
+            with self.config.transaction():
+                # Hotkeys
+                if "Hotkeys" in built:
+                    ptt_keys = _HOTKEY_KEY_RE.findall(self.ptt_entry.get().strip())
+                    toggle_keys = _HOTKEY_KEY_RE.findall(self.toggle_entry.get().strip())
+
+                    self.config.set('hotkeys.push_to_talk', [k.lower() for k in ptt_keys])
+                    self.config.set('hotkeys.toggle_recording', [k.lower() for k in toggle_keys])
+
+                # Audio
+                if "Audio" in built:
+                    self.config.set('audio.sample_rate', int(self.sample_rate_combo.get()))
+
+                # Whisper
+                if "Transcription" in built:
+                    model_size = _MODEL_LABEL_TO_KEY.get(self.model_combo.get())
+                    if model_size is not None:
+                        self.config.set('whisper.model_size', model_size)
+
+                    self.config.set('whisper.language', self.language_combo.get())
+                    self.config.set('whisper.task', self.task_combo.get())
+
+                # Behavior
+                if "Behavior" in built:
+                    self.config.set('behavior.auto_punctuation', bool(self.auto_punctuation.get()))
+                    self.config.set('behavior.capitalize_sentences', bool(self.capitalize_sentences.get()))
+                    self.config.set('behavior.remove_filler_words', bool(self.remove_filler_words.get()))
+                    self.config.set('behavior.confidence_threshold', self.confidence_slider.get())
+
+                # UI
+                if "Interface" in built:
+                    self.config.set('ui.theme', self.theme_combo.get())
+                    self.config.set('ui.minimize_to_tray', bool(self.minimize_to_tray.get()))
+                    self.config.set('ui.show_notifications', bool(self.show_notifications.get()))
+                    # self.config.set('ui.auto_start', bool(self.auto_start.get()))
+
+            # Apply theme change (re-renders every widget, so only when it changed)
+            if "Interface" in built:
+                new_theme = self.theme_combo.get()
+                if new_theme != old_theme:
+                    ctk.set_appearance_mode(new_theme)
 
             messagebox.showinfo("Settings", "Settings saved successfully!")
             self.close_window()
@@ -1195,6 +1777,12 @@ class SettingsWindow:
 class BackgroundPopup:
     """Sleek background popup with recording animation and controls"""
 
+    # Pulsing red animation
+    ANIMATION_COLORS = ("#ff4444", "#ff6666", "#ff8888", "#ffaaaa", "#ff8888", "#ff6666")
+    ANIMATION_INTERVAL_MS = 250
+    IDLE_COLOR = "#808080"
+    DRAG_BINDTAG = "DraggablePopupArea"
+
     def __init__(self, parent_app):
         """Sleek background popup with recording animation and controls"""
         self.parent_app = parent_app
@@ -1202,7 +1790,20 @@ class BackgroundPopup:
         self.is_visible = False
         self.animation_active = False
         self.animation_frame = 0
+        # Widgets are created lazily by create_popup on first show
+        self.mic_label = None
+        self.status_label = None
+        self.status_dot = None
+        self.stop_button = None
+        self.settings_button = None
+        self._last_anim_color = None
+        # Observed lateness of animation frames, used to correct the next after() delay
+        self._anim_delays = deque(maxlen=50)
+        self._last_anim_t = None
+        self._anim_wait_ms = self.ANIMATION_INTERVAL_MS
         self.drag_data = {"x": 0, "y": 0}
+        self._pending_xy = (0, 0)
+        self._drag_scheduled = False
 
     def create_popup(self):
         """Create the enhanced background popup with controls"""
@@ -1220,6 +1821,12 @@ class BackgroundPopup:
             # Position at bottom middle
             self.popup.geometry("+{}+738".format(self.popup.winfo_screenwidth() - 765))
 
+            # Pre-render the status dot and mic icon once per color; animation only swaps images
+            colors = self.ANIMATION_COLORS + (self.IDLE_COLOR,)
+            self._dot_images = {color: self._render_dot(color) for color in colors}
+            mic_mask = self._mic_mask()
+            self._mic_images = {color: self._tint(mic_mask, color, 16) for color in colors}
+
             # Create main frame with rounded appearance
             self.main_frame = ctk.CTkFrame(
                 self.popup,
@@ -1230,10 +1837,6 @@ class BackgroundPopup:
             )
             self.main_frame.pack(fill="both", expand=True, padx=2, pady=2)
 
-            # Enable dragging
-            self.main_frame.bind("<Button-1>", self.start_drag)
-            self.main_frame.bind("<B1-Motion>", self.on_drag)
-
             # Single row with all elements
             self.content_frame = ctk.CTkFrame(
                 self.main_frame,
@@ -1243,10 +1846,6 @@ class BackgroundPopup:
             self.content_frame.pack(fill="both", expand=True, padx=5, pady=5)
             self.content_frame.pack_propagate(False)
 
-            # Make content frame draggable too
-            self.content_frame.bind("<Button-1>", self.start_drag)
-            self.content_frame.bind("<B1-Motion>", self.on_drag)
-
             # Left side: Mic icon and status
             self.left_frame = ctk.CTkFrame(
                 self.content_frame,
@@ -1256,23 +1855,19 @@ class BackgroundPopup:
 
             self.mic_label = ctk.CTkLabel(
                 self.left_frame,
-                text="🎤",
-                font=ctk.CTkFont(size=14),
-                text_color="gray"
+                text="",
+                image=self._mic_images[self.IDLE_COLOR],
+                width=16
             )
             self.mic_label.pack(side="left", pady=3)
-            self.mic_label.bind("<Button-1>", self.start_drag)
-            self.mic_label.bind("<B1-Motion>", self.on_drag)
 
             self.status_label = ctk.CTkLabel(
                 self.left_frame,
                 text="Ready",
-                font=ctk.CTkFont(size=9),
+                font=_font(9),
                 text_color="gray"
             )
             self.status_label.pack(side="left", padx=(3, 0), pady=2)
-            self.status_label.bind("<Button-1>", self.start_drag)
-            self.status_label.bind("<B1-Motion>", self.on_drag)
 
             # Right side: Control buttons
             self.button_frame = ctk.CTkFrame(
@@ -1287,7 +1882,7 @@ class BackgroundPopup:
                 text="⏹",  # Stop symbol
                 width=10,
                 height=20,
-                font=ctk.CTkFont(size=10),
+                font=_font(10),
                 fg_color=("#cc4444", "#aa3333"),
                 hover_color=("#dd5555", "#bb4444"),
                 command=self.stop_recording
@@ -1301,7 +1896,7 @@ class BackgroundPopup:
                 text="⚙",  # Settings gear symbol
                 width=10,
                 height=20,
-                font=ctk.CTkFont(size=10),
+                font=_font(10),
                 fg_color=("#444444", "#333333"),
                 hover_color=("#555555", "#444444"),
                 command=self.open_settings
@@ -1311,13 +1906,11 @@ class BackgroundPopup:
             # Status dot (moved to far right)
             self.status_dot = ctk.CTkLabel(
                 self.button_frame,
-                text="● ",
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
+                text="",
+                image=self._dot_images[self.IDLE_COLOR],
+                width=12
             )
             self.status_dot.pack(side="right", padx=(2, 0), pady=2)
-            self.status_dot.bind("<Button-1>", self.start_drag)
-            self.status_dot.bind("<B1-Motion>", self.on_drag)
 
             # Close button
             # self.close_button = ctk.CTkButton(
@@ -1325,36 +1918,84 @@ class BackgroundPopup:
             #     text="×",
             #     width=20,
             #     height=20,
-            #     font=ctk.CTkFont(size=12, weight="bold"),
+            #     font=_font(12, "bold"),
             #     fg_color=("#666666", "#555555"),
             #     hover_color=("#777777", "#666666"),
             #     command=self.hide_popup
             # )
             # self.close_button.pack(side="right")
 
+            # Enable dragging: one class binding shared by every draggable area
+            self.popup.bind_class(self.DRAG_BINDTAG, "<Button-1>", self.start_drag)
+            self.popup.bind_class(self.DRAG_BINDTAG, "<B1-Motion>", self.on_drag)
+            for widget in (self.main_frame, self.content_frame, self.mic_label,
+                           self.status_label, self.status_dot):
+                self._add_drag_bindtag(widget)
+
             # Hide initially
             self.popup.withdraw()
 
+    def _add_drag_bindtag(self, widget):
+        """Tag a CTk widget and the tk widgets it draws with (clicks land on those)"""
+        parts = [widget] + [child for child in widget.winfo_children()
+                            if not isinstance(child, ctk.CTkBaseClass)]
+        for part in parts:
+            part.bindtags(part.bindtags() + (self.DRAG_BINDTAG,))
+
+    @staticmethod
+    def _mic_mask(size=64):
+        """Draw a microphone silhouette as an alpha mask (supersampled)"""
+        mask = Image.new("L", (size, size), 0)
+        draw = ImageDraw.Draw(mask)
+        u = size / 16
+        draw.rounded_rectangle((5.5 * u, 1 * u, 10.5 * u, 10 * u), radius=2.5 * u, fill=255)
+        draw.arc((3.5 * u, 4 * u, 12.5 * u, 12.5 * u), start=0, end=180, fill=255, width=int(u))
+        draw.line((8 * u, 12.5 * u, 8 * u, 14.5 * u), fill=255, width=int(u))
+        draw.line((5.5 * u, 15 * u, 10.5 * u, 15 * u), fill=255, width=int(u))
+        return mask
+
+    @staticmethod
+    def _tint(mask, color, size):
+        """Fill an alpha mask with a solid color and scale it to a CTkImage"""
+        image = Image.new("RGBA", mask.size, color)
+        image.putalpha(mask)
+        image = image.resize((size, size), Image.LANCZOS)
+        return ctk.CTkImage(light_image=image, dark_image=image, size=(size, size))
+
+    @staticmethod
+    def _render_dot(color, size=8):
+        """Render a filled circle as a CTkImage"""
+        scale = 4  # Supersample for a smooth edge
+        image = Image.new("RGBA", (size * scale, size * scale), (0, 0, 0, 0))
+        ImageDraw.Draw(image).ellipse((0, 0, size * scale - 1, size * scale - 1), fill=color)
+        image = image.resize((size, size), Image.LANCZOS)
+        return ctk.CTkImage(light_image=image, dark_image=image, size=(size, size))
+
     def start_drag(self, event):
         """Start dragging the popup"""
         self.drag_data["x"] = event.x_root - self.popup.winfo_x()
         self.drag_data["y"] = event.y_root - self.popup.winfo_y()
 
-    def on_drag(self, event):
-        """Handle popup dragging"""
-        new_x = event.x_root - self.drag_data["x"]
-        new_y = event.y_root - self.drag_data["y"]
+        # Screen and popup size cannot change mid-drag; query them once
+        self.drag_data["max_x"] = self.popup.winfo_screenwidth() - self.popup.winfo_width()
+        self.drag_data["max_y"] = self.popup.winfo_screenheight() - self.popup.winfo_height()
 
+    def on_drag(self, event):
+        """Handle popup dragging (moves are applied at most once per idle cycle)"""
         # Keep popup within screen bounds
-        screen_width = self.popup.winfo_screenwidth()
-        screen_height = self.popup.winfo_screenheight()
-        popup_width = self.popup.winfo_width()
-        popup_height = self.popup.winfo_height()
+        new_x = max(0, min(event.x_root - self.drag_data["x"], self.drag_data["max_x"]))
+        new_y = max(0, min(event.y_root - self.drag_data["y"], self.drag_data["max_y"]))
 
-        new_x = max(0, min(new_x, screen_width - popup_width))
-        new_y = max(0, min(new_y, screen_height - popup_height))
+        self._pending_xy = (new_x, new_y)
+        if not self._drag_scheduled:
+            self._drag_scheduled = True
+            self.popup.after_idle(self._apply_drag)
 
-        self.popup.geometry(f"+{new_x}+{new_y}")
+    def _apply_drag(self):
+        """Move the popup to the latest dragged position"""
+        self._drag_scheduled = False
+        if self.popup:
+            self.popup.geometry("+{}+{}".format(*self._pending_xy))
 
     def stop_recording(self):
         """Stop recording through parent app"""
@@ -1397,73 +2038,120 @@ class BackgroundPopup:
         """Start the recording animation"""
         self.animation_active = True
         self.animation_frame = 0
+        self._anim_delays.clear()
+        self._last_anim_t = None
         self.update_status("Recording...", recording=True)
         self.animate_recording()
 
     def stop_recording_animation(self):
         """Stop the recording animation"""
         self.animation_active = False
+        self._last_anim_color = None
         self.update_status("Ready", recording=False)
         if self.mic_label:
-            self.mic_label.configure(text_color="gray")
+            self.mic_label.configure(image=self._mic_images[self.IDLE_COLOR])
         if self.status_dot:
-            self.status_dot.configure(text_color="gray")
+            self.status_dot.configure(image=self._dot_images[self.IDLE_COLOR])
 
     def animate_recording(self):
         """Animate the recording indicator"""
         if not self.animation_active or not self.popup:
             return
 
-        # Pulsing red animation
-        colors = ["#ff4444", "#ff6666", "#ff8888", "#ffaaaa", "#ff8888", "#ff6666"]
-        color = colors[self.animation_frame % len(colors)]
+        color = self.ANIMATION_COLORS[self.animation_frame % len(self.ANIMATION_COLORS)]
 
-        if self.mic_label:
-            self.mic_label.configure(text_color=color)
-        if self.status_dot:
-            self.status_dot.configure(text_color=color)
+        # Only touch the widgets when the color actually changes
+        if color != self._last_anim_color:
+            self._last_anim_color = color
+            if self.mic_label:
+                self.mic_label.configure(image=self._mic_images[color])
+            if self.status_dot:
+                self.status_dot.configure(image=self._dot_images[color])
 
         self.animation_frame += 1
 
-        # Schedule next frame
+        # Schedule next frame, compensating for how late frames have been firing
         if self.popup:
-            self.popup.after(200, self.animate_recording)
+            self._anim_wait_ms = self._next_animation_wait()
+            self.popup.after(self._anim_wait_ms, self.animate_recording)
+
+    def _next_animation_wait(self):
+        """Delay until the next frame so frames land on the target interval"""
+        now = time.perf_counter()
+        if self._last_anim_t is not None:
+            self._anim_delays.append((now - self._last_anim_t) * 1000 - self._anim_wait_ms)
+        self._last_anim_t = now
+
+        if len(self._anim_delays) < 5:
+            return self.ANIMATION_INTERVAL_MS
+        lateness = statistics.median(self._anim_delays)
+        return max(1, int(self.ANIMATION_INTERVAL_MS - lateness))
 
 
 # This class for auto-start management
 class AutoStartManager:
     """Manages Windows auto-start functionality"""
 
+    STATE_TTL = 2.0  # Seconds a registry lookup result is reused
+
     def __init__(self, app_name="VoiceType Pro"):
         self.app_name = app_name
         self.registry_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
+        self._exe_path = self._build_command()
+        self._cached_state = None
+        self._cached_at = 0.0
+
+    def _build_command(self):
+        """Command line stored in the Run key"""
+        exe_path = sys.executable
+        if exe_path.endswith("python.exe"):
+            # If running from Python, use the script path
+            script_path = os.path.abspath(__file__)
+            return f'"{exe_path}" "{script_path}"'
+        return f'"{exe_path}"'
+
+    def _open_run_key(self, access):
+        """Open the current user's Run key"""
+        return winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0,
+                              access | winreg.KEY_WOW64_64KEY)
+
+    def _invalidate_state(self):
+        """Forget the cached auto-start state"""
+        self._cached_state = None
 
     def is_auto_start_enabled(self):
         """Check if auto-start is currently enabled"""
+        now = time.monotonic()
+        if self._cached_state is not None and now - self._cached_at < self.STATE_TTL:
+            return self._cached_state
+
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as key:
-                try:
-                    winreg.QueryValueEx(key, self.app_name)
-                    return True
-                except FileNotFoundError:
-                    return False
+            key = self._open_run_key(winreg.KEY_READ)
         except Exception as e:
             logger.error(f"Error checking auto-start status: {e}")
             return False
 
+        try:
+            winreg.QueryValueEx(key, self.app_name)
+            enabled = True
+        except FileNotFoundError:
+            enabled = False
+        except Exception as e:
+            logger.error(f"Error checking auto-start status: {e}")
+            return False
+        finally:
+            winreg.CloseKey(key)
+
+        self._cached_state = enabled
+        self._cached_at = now
+        return enabled
+
     def enable_auto_start(self):
         """Enable auto-start on Windows boot"""
+        self._invalidate_state()
         try:
-            exe_path = sys.executable
-            if exe_path.endswith("python.exe"):
-                # If running from Python, use the script path
-                script_path = os.path.abspath(__file__)
-                exe_path = f'"{exe_path}" "{script_path}"'
-            else:
-                exe_path = f'"{exe_path}"'
-
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_SET_VALUE) as key:
-                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, exe_path)
+            with self._open_run_key(winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, self._exe_path)
 
             logger.info("Auto-start enabled successfully")
             return True
@@ -1474,8 +2162,9 @@ class AutoStartManager:
 
     def disable_auto_start(self):
         """Disable auto-start on Windows boot"""
+        self._invalidate_state()
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_SET_VALUE) as key:
+            with self._open_run_key(winreg.KEY_SET_VALUE) as key:
                 try:
                     winreg.DeleteValue(key, self.app_name)
                     logger.info("Auto-start disabled successfully")
@@ -1488,32 +2177,10 @@ class AutoStartManager:
             logger.error(f"Error disabling auto-start: {e}")
             return False
 
-
 def main():
     """Main entry point"""
     try:
-        # Check required dependencies
-        required_packages = [
-            'whisper', 'torch', 'pyaudio', 'sounddevice',
-            'pynput', 'customtkinter', 'pystray', 'pyperclip'
-        ]
-
-        missing_packages = []
-        for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
-                missing_packages.append(package)
-
-        if missing_packages:
-            print("Missing required packages:")
-            for package in missing_packages:
-                print(f"  - {package}")
-            print("\nInstall missing packages with:")
-            print(f"pip install {' '.join(missing_packages)}")
-            return
-
-        # Create and run application
+        # Dependencies are checked at the top of the file, before they are imported
         app = VoiceTypeProApp()
         app.run()
 
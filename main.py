@@ -8,31 +8,41 @@
 # Add modules directory to path
 import sys
 import os
+import json
 import logging
+import importlib.util
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent / "modules"))
 
-# Import and run the main application
-from modules.core.main_app import VoiceTypeProApp
-
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def configured_backend():
+    """Read whisper.backend from the saved config without creating or writing the file"""
+    config_file = Path.home() / ".voicetype_pro" / "config.json"
+    try:
+        return json.loads(config_file.read_text(encoding="utf-8"))['whisper']['backend']
+    except (OSError, ValueError, KeyError, TypeError):
+        return 'faster'
+
 def check_dependencies():
     """Check for required packages"""
-    required_packages = [
-        'whisper', 'torch', 'pyaudio', 'sounddevice', 'pynput', 
-        'customtkinter', 'pystray', 'pyperclip', 'pygame', 'librosa'
-    ]
+    # Import name -> pip distribution name
+    required_packages = {
+        'faster_whisper': 'faster-whisper', 'pyaudio': 'pyaudio',
+        'sounddevice': 'sounddevice', 'pynput': 'pynput', 'customtkinter': 'customtkinter',
+        'pystray': 'pystray', 'pyperclip': 'pyperclip', 'pygame': 'pygame', 'librosa': 'librosa'
+    }
+
+    # The reference PyTorch backend is only needed when selected in the config
+    if configured_backend() == 'torch':
+        required_packages.update({'whisper': 'openai-whisper', 'torch': 'torch'})
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the module; importing torch/whisper here would cost seconds
+    missing_packages = [pip_name for module, pip_name in required_packages.items()
+                        if importlib.util.find_spec(module) is None]
     
     if missing_packages:
         print("Missing required packages:")
@@ -48,6 +58,9 @@ def main():
         if not check_dependencies():
             return
         
+        # Import the application only once its dependencies are known to exist
+        from modules.core.main_app import VoiceTypeProApp
+        
         app = VoiceTypeProApp()
         app.run()
         
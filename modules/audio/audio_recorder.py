@@ -9,11 +9,36 @@ import threading
 import time
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # Optional: NumPy fallback below
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+
+if njit:
+    @njit(cache=True, fastmath=True)
+    def _below_threshold(x, threshold_sq):
+        """True when the chunk's mean square is below threshold_sq (one fused pass)"""
+        s = 0.0
+        for v in x:
+            s += v * v
+        return s < threshold_sq * x.size
+else:
+    def _below_threshold(x, threshold_sq):
+        """True when the chunk's mean square is below threshold_sq (one float64 reduction)"""
+        # Accumulate in float64 (int16 products would overflow an int16 dot) without
+        # converting the whole chunk first: einsum casts through a small internal buffer
+        return float(np.einsum('i,i->', x, x, dtype=np.float64)) < threshold_sq * x.size
+
+
 class AudioRecorder:
     """Enhanced audio recorder with proper callback handling"""
 
+    INITIAL_BUFFER_SECONDS = 60
+    DEVICE_CACHE_TTL = 5.0  # Seconds a device enumeration is reused
+
     def __init__(self, config_manager, sound_manager):
         self.config = config_manager
         self.sound_manager = sound_manager
@@ -23,12 +48,30 @@ class AudioRecorder:
         self.chunk_size = self.config.get('audio.chunk_size', 1024)
         self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.audio_data = []
+        # Preallocated int16 capture buffer (half the bandwidth of float32); the callback
+        # copies each chunk in at _w and samples are converted to float once at stop
+        # (an array.array would also amortize growth, but appending a chunk to it goes
+        # through chunk.tobytes(), an extra copy in every callback)
+        self._buf = np.empty(int(self.sample_rate * self.INITIAL_BUFFER_SECONDS), dtype=np.int16)
+        self._w = 0
         self.silence_start = None
         self.silence_timeout = self.config.get('audio.silence_timeout', 2.0)
         self.auto_stop_callback = None
         self.auto_stop_enabled = False
+        self._threshold_sq = (0.02 * 32768) ** 2
+        self._silence_timeout_ns = int(self.silence_timeout * 1e9)
+        self._auto_stop_active = False
+        self._callback_error = None
         self._record_lock = threading.Lock()
+        self._device_cache = None
+        self._device_cache_time = 0.0
+
+        # Pre-started worker that runs auto_stop_callback off the PortAudio thread
+        self._auto_stop_evt = threading.Event()
+        threading.Thread(target=self._auto_stop_worker, daemon=True).start()
+
+        # Compile the silence check now so the first audio callback is not slowed by the JIT
+        _below_threshold(np.zeros(self.chunk_size, dtype=np.int16), self._threshold_sq)
 
     def start_recording(self, auto_stop=False):
         """Start recording with proper locking"""
@@ -40,11 +83,19 @@ class AudioRecorder:
             try:
                 self.is_recording = True
                 self.auto_stop_enabled = auto_stop
-                self.audio_data = []
+                # Snapshot everything the realtime callback needs into plain attributes
+                # Threshold is configured as a fraction of full scale; compare in int16 units
+                threshold = float(self.config.get('audio.voice_activation_threshold', 0.02)) * 32768
+                self._threshold_sq = threshold * threshold
+                silence_timeout = float(self.config.get('audio.silence_timeout', self.silence_timeout))
+                self._silence_timeout_ns = int(silence_timeout * 1e9)
+                self._auto_stop_active = auto_stop and self.auto_stop_callback is not None
+                self._w = 0
                 self.silence_start = None
+                self._callback_error = None
 
                 self.stream = self.audio.open(
-                    format=pyaudio.paFloat32,
+                    format=pyaudio.paInt16,
                     channels=self.channels,
                     rate=self.sample_rate,
                     input=True,
@@ -72,6 +123,7 @@ class AudioRecorder:
             try:
                 self.is_recording = False
                 self.auto_stop_enabled = False
+                self._auto_stop_active = False
 
                 if self.stream:
                     self.stream.stop_stream()
@@ -80,8 +132,14 @@ class AudioRecorder:
 
                 self.sound_manager.play_sound('stop')
 
-                if self.audio_data:
-                    audio_array = np.concatenate(self.audio_data)
+                if self._callback_error is not None:
+                    logger.error(f"Error in audio callback: {self._callback_error}")
+                    self._callback_error = None
+
+                if self._w:
+                    # Convert out (also a copy: the buffer is reused by the next recording)
+                    audio_array = self._buf[:self._w].astype(np.float32)
+                    audio_array *= 1.0 / 32768.0
                     logger.info(f"Recording stopped, captured {len(audio_array)} samples")
                     return audio_array
 
@@ -95,37 +153,59 @@ class AudioRecorder:
         if not self.is_recording:
             return (in_data, pyaudio.paComplete)
 
-        try:
-            audio_chunk = np.frombuffer(in_data, dtype=np.float32)
-            self.audio_data.append(audio_chunk)
+        # audio_chunk is a read-only view of PortAudio's buffer, which is reused after
+        # this callback returns: never keep a reference, _append copies it exactly once
+        audio_chunk = np.frombuffer(in_data, dtype=np.int16)
+        self._append(audio_chunk)
 
-            # Auto-stop detection
-            if self.auto_stop_enabled and self.auto_stop_callback:
-                rms = np.sqrt(np.mean(audio_chunk**2))
-                threshold = self.config.get('audio.voice_activation_threshold', 0.02)
-
-                if rms < threshold:
+        # Auto-stop detection
+        if self._auto_stop_active:
+            try:
+                if _below_threshold(audio_chunk, self._threshold_sq):
+                    now = time.monotonic_ns()
                     if self.silence_start is None:
-                        self.silence_start = time.time()
-                    elif time.time() - self.silence_start > self.silence_timeout:
-                        # Trigger auto-stop in main thread
-                        threading.Timer(0.01, self._trigger_auto_stop).start()
+                        self.silence_start = now
+                    elif now - self.silence_start > self._silence_timeout_ns:
+                        # Wake the auto-stop worker; the callback must not block
+                        self._auto_stop_evt.set()
                         return (in_data, pyaudio.paComplete)
                 else:
                     self.silence_start = None
-
-        except Exception as e:
-            logger.error(f"Error in audio callback: {e}")
+            except Exception as e:
+                # Reported by stop_recording; logging here would stall the audio thread
+                self._callback_error = e
 
         return (in_data, pyaudio.paContinue)
 
-    def _trigger_auto_stop(self):
-        """Trigger auto-stop from callback"""
-        if self.auto_stop_callback:
-            self.auto_stop_callback()
+    def _append(self, chunk):
+        """Copy a chunk into the capture buffer, doubling it when full"""
+        w = self._w
+        end = w + chunk.shape[0]
+        if end > self._buf.shape[0]:
+            grown = np.empty(max(end, self._buf.shape[0] * 2), dtype=self._buf.dtype)
+            grown[:w] = self._buf[:w]
+            self._buf = grown
+        self._buf[w:end] = chunk
+        self._w = end
+
+    def _auto_stop_worker(self):
+        """Run the auto-stop callback whenever the audio callback requests it"""
+        while True:
+            self._auto_stop_evt.wait()
+            self._auto_stop_evt.clear()
+            callback = self.auto_stop_callback
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Error in auto-stop callback: {e}")
 
     def get_audio_devices(self):
-        """Get available audio devices"""
+        """Get available audio devices (enumeration is reused for DEVICE_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        if self._device_cache is not None and now - self._device_cache_time < self.DEVICE_CACHE_TTL:
+            return self._device_cache
+
         devices = []
         try:
             for i in range(self.audio.get_device_count()):
@@ -138,8 +218,16 @@ class AudioRecorder:
                     })
         except Exception as e:
             logger.error(f"Error getting audio devices: {e}")
+            return devices
+
+        self._device_cache = devices
+        self._device_cache_time = now
         return devices
 
+    def invalidate_device_cache(self):
+        """Force the next get_audio_devices call to enumerate again"""
+        self._device_cache_time = 0.0
+
     def cleanup(self):
         """Cleanup resources"""
         try:
@@ -3,9 +3,10 @@
 # File: modules/audio/sound_manager.py
 # =============================================================================
 
-import pygame
 import numpy as np
+from pathlib import Path
 import threading
+import queue
 import time
 import logging
 
@@ -14,21 +15,28 @@ logger = logging.getLogger(__name__)
 class SoundManager:
     """Manages sound effects with proper initialization"""
 
+    SOUND_NAMES = ('start', 'stop', 'wake_word')
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.sounds = {}
         self.initialized = False
         self.volume = self.config.get('sounds.volume', 0.7)
         self._init_lock = threading.Lock()
-        self.initialize_audio()
+        # pygame and its mixer are loaded on the first play_sound (see initialize_audio)
+
+        # One long-lived player thread instead of a new thread per sound
+        self._play_q = queue.SimpleQueue()
+        threading.Thread(target=self._player_loop, daemon=True).start()
 
     def initialize_audio(self):
-        """Initialize pygame mixer with error handling"""
+        """Import pygame and initialize its mixer (deferred until a sound is first played)"""
         with self._init_lock:
             if self.initialized:
                 return
 
             try:
+                import pygame
                 pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
                 pygame.mixer.init()
                 self.initialized = True
@@ -44,64 +52,102 @@ class SoundManager:
             return
 
         try:
+            import pygame  # Already loaded by initialize_audio
             sample_rate = 22050
-            duration = 0.3
-
-            # Start recording sound (ascending beep)
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            start_freq = np.linspace(600, 800, len(t))
-            start_tone = np.sin(2 * np.pi * start_freq * t) * self.volume
-            start_sound = np.array([start_tone, start_tone]).T
-            self.sounds['start'] = pygame.sndarray.make_sound((start_sound * 32767).astype(np.int16))
-
-            # Stop recording sound (descending beep)
-            stop_freq = np.linspace(800, 600, len(t))
-            stop_tone = np.sin(2 * np.pi * stop_freq * t) * self.volume
-            stop_sound = np.array([stop_tone, stop_tone]).T
-            self.sounds['stop'] = pygame.sndarray.make_sound((stop_sound * 32767).astype(np.int16))
-
-            # Wake word sound (chime sequence)
-            chime_duration = 0.8
-            t_chime = np.linspace(0, chime_duration, int(sample_rate * chime_duration))
-            chime_freqs = [523, 659, 784]  # C, E, G
-            chime_sound = np.zeros((len(t_chime), 2))
-
-            for i, freq in enumerate(chime_freqs):
-                start_idx = int(i * len(t_chime) / 3)
-                end_idx = int((i + 1) * len(t_chime) / 3)
-                segment_len = end_idx - start_idx
-                t_segment = np.linspace(0, chime_duration/3, segment_len)
-
-                tone = np.sin(2 * np.pi * freq * t_segment) * self.volume * np.exp(-t_segment * 2)
-                chime_sound[start_idx:end_idx, 0] = tone
-                chime_sound[start_idx:end_idx, 1] = tone
-
-            self.sounds['wake_word'] = pygame.sndarray.make_sound((chime_sound * 32767).astype(np.int16))
+            cache_path = Path.home() / ".voicetype_pro" / f"sounds_{round(self.volume * 100)}_{sample_rate}.npz"
+
+            arrays = None
+            if cache_path.exists():
+                try:
+                    with np.load(cache_path) as cached:
+                        arrays = {name: cached[name] for name in self.SOUND_NAMES}
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable sound cache: {e}")
+
+            if arrays is None:
+                arrays = self._generate_sounds(sample_rate)
+                try:
+                    cache_path.parent.mkdir(exist_ok=True)
+                    np.savez(cache_path, **arrays)
+                except Exception as e:
+                    logger.warning(f"Could not write sound cache: {e}")
+
+            for name, samples in arrays.items():
+                self.sounds[name] = pygame.sndarray.make_sound(samples)
 
             logger.info("Sound effects created successfully")
 
         except Exception as e:
             logger.error(f"Error creating sounds: {e}")
 
+    def _generate_sounds(self, sample_rate):
+        """Synthesize the stereo int16 sample arrays for each sound effect"""
+        duration = 0.3
+
+        # Start recording sound (ascending beep)
+        t = np.linspace(0, duration, int(sample_rate * duration))
+        start_freq = np.linspace(600, 800, len(t))
+        start_tone = np.sin(2 * np.pi * start_freq * t) * self.volume
+
+        # Stop recording sound (descending beep)
+        stop_freq = np.linspace(800, 600, len(t))
+        stop_tone = np.sin(2 * np.pi * stop_freq * t) * self.volume
+
+        # Wake word sound (chime sequence)
+        chime_duration = 0.8
+        n_chime = int(sample_rate * chime_duration)
+        chime_freqs = np.array([523, 659, 784])  # C, E, G
+
+        # Three equal segments; each sample's segment and time within it, in one pass
+        idx = np.arange(n_chime)
+        bounds = np.arange(4) * n_chime // 3
+        seg = np.searchsorted(bounds, idx, side='right') - 1
+        seg_len = bounds[seg + 1] - bounds[seg]
+        t_in = (idx - bounds[seg]) * (chime_duration / 3) / np.maximum(seg_len - 1, 1)
+
+        chime_tone = np.sin(2 * np.pi * chime_freqs[seg] * t_in) * self.volume * np.exp(-t_in * 2)
+
+        return {
+            'start': self._to_stereo(start_tone),
+            'stop': self._to_stereo(stop_tone),
+            'wake_word': self._to_stereo(chime_tone),
+        }
+
+    @staticmethod
+    def _to_stereo(tone):
+        """Scale a mono float tone to int16 once and write it to both channels of a contiguous buffer"""
+        samples = (tone * 32767).astype(np.int16)
+        stereo = np.empty((len(samples), 2), dtype=np.int16)
+        stereo[:, 0] = samples
+        stereo[:, 1] = samples
+        return stereo
+
     def play_sound(self, sound_type):
-        """Play sound effect with threading"""
-        def _play():
-            try:
-                if not self.config.get('sounds.enabled', True):
-                    return
+        """Queue a sound effect for the player thread (never blocks the caller)"""
+        self._play_q.put(sound_type)
+
+    def _player_loop(self):
+        """Play queued sounds on the persistent player thread"""
+        while True:
+            self._play(self._play_q.get())
 
-                if not self.config.get(f'sounds.{sound_type}', True):
-                    return
+    def _play(self, sound_type):
+        """Play a sound effect if enabled"""
+        try:
+            # One dict read for both checks instead of two dotted-path walks
+            sound_config = self.config.get('sounds', {})
+            if not sound_config.get('enabled', True):
+                return
 
-                if not self.initialized:
-                    self.initialize_audio()
+            if not sound_config.get(sound_type, True):
+                return
 
-                if sound_type in self.sounds:
-                    self.sounds[sound_type].play()
-                    logger.debug(f"Played sound: {sound_type}")
+            if not self.initialized:
+                self.initialize_audio()
 
-            except Exception as e:
-                logger.error(f"Error playing sound {sound_type}: {e}")
+            if sound_type in self.sounds:
+                self.sounds[sound_type].play()
+                logger.debug(f"Played sound: {sound_type}")
 
-        # Play sound in separate thread to avoid blocking
-        threading.Thread(target=_play, daemon=True).start()
+        except Exception as e:
+            logger.error(f"Error playing sound {sound_type}: {e}")
@@ -4,6 +4,13 @@
 # =============================================================================
 
 import json
+import os
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 import logging
 
@@ -12,6 +19,8 @@ logger = logging.getLogger(__name__)
 class ConfigManager:
     """Manages application configuration and settings"""
 
+    SAVE_DELAY = 0.5  # Seconds to wait for further changes before writing
+
     def __init__(self):
         self.config_file = Path.home() / ".voicetype_pro" / "config.json"
         self.config_file.parent.mkdir(exist_ok=True)
@@ -31,11 +40,15 @@ class ConfigManager:
             "whisper": {
                 "model_size": "base",
                 "language": "auto",
-                "task": "transcribe"
+                "task": "transcribe",
+                "backend": "faster",
+                "batch_size": 8,
+                "cpu_threads": None
             },
             "voice_assistant": {
                 "enabled": True,
                 "wake_word": "hey soffy",
+                "wake_word_model": None,
                 "sensitivity": 0.5,
                 "auto_stop_timeout": 3.0,
                 "continuous_listening": True
@@ -44,7 +57,8 @@ class ConfigManager:
                 "theme": "dark",
                 "minimize_to_tray": True,
                 "show_notifications": True,
-                "auto_start": False
+                "auto_start": False,
+                "auto_start_method": "registry"
             },
             "behavior": {
                 "auto_punctuation": True,
@@ -60,14 +74,23 @@ class ConfigManager:
                 "volume": 0.7
             }
         }
+        self._split_cache = {}
+        self._dirty = False
+        self._batch_depth = 0
+        self._batch_changes = set()
+        self._save_timer = None
+        self._save_lock = threading.Lock()
         self.load_config()
 
     def load_config(self):
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    self.config = self._deep_merge(self.default_config, loaded_config)
+                if orjson:
+                    loaded_config = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r') as f:
+                        loaded_config = json.load(f)
+                self.config = self._deep_merge(self.default_config, loaded_config)
             else:
                 self.config = self.default_config.copy()
                 self.save_config()
@@ -86,14 +109,65 @@ class ConfigManager:
         return result
 
     def save_config(self):
+        """Write the config atomically (temp file + os.replace)"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            tmp_file = self.config_file.with_suffix('.tmp')
+            if orjson:
+                tmp_file.write_bytes(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             logger.error(f"Error saving config: {e}")
 
+    def _schedule_save(self):
+        """Mark dirty and write once the burst of set() calls settles"""
+        with self._save_lock:
+            self._dirty = True
+            if self._batch_depth or self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes now"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self.save_config()
+
+    @contextmanager
+    def batch(self):
+        """Group set() calls into a single write; yields the set of top-level sections changed"""
+        with self._save_lock:
+            if self._batch_depth == 0:
+                self._batch_changes = set()
+            self._batch_depth += 1
+            changes = self._batch_changes
+        try:
+            yield changes
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
+
+    def _split_key(self, key_path):
+        """Split a dot-notation key once and reuse the tuple on later lookups"""
+        keys = self._split_cache.get(key_path)
+        if keys is None:
+            keys = self._split_cache[key_path] = tuple(key_path.split('.'))
+        return keys
+
     def get(self, key_path, default=None):
-        keys = key_path.split('.')
+        keys = self._split_key(key_path)
         value = self.config
         for key in keys:
             value = value.get(key, default)
@@ -102,9 +176,15 @@ class ConfigManager:
         return value
 
     def set(self, key_path, value):
-        keys = key_path.split('.')
+        """Set a value, returning True only when it actually changed"""
+        keys = self._split_key(key_path)
         config = self.config
         for key in keys[:-1]:
             config = config.setdefault(key, {})
+        if keys[-1] in config and config[keys[-1]] == value:
+            return False
         config[keys[-1]] = value
-        self.save_config()
+        if self._batch_depth:
+            self._batch_changes.add(keys[0])
+        self._schedule_save()
+        return True
@@ -15,6 +15,15 @@ logger = logging.getLogger(__name__)
 class HotkeyManager:
     """Enhanced hotkey manager with modular handlers"""
 
+    # pynput special key names -> names used in hotkey config
+    _NAME_MAP = {
+        'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
+        'alt_l': 'alt', 'alt_r': 'alt',
+        'shift_l': 'shift', 'shift_r': 'shift',
+        'cmd': 'win', 'cmd_l': 'win', 'cmd_r': 'win',
+        'win': 'win', 'win_l': 'win', 'win_r': 'win'
+    }
+
     def __init__(self, config_manager, callback_handler):
         self.config = config_manager
         self.callback_handler = callback_handler
@@ -25,8 +34,21 @@ class HotkeyManager:
         self.push_to_talk = PushToTalkHandler(config_manager, callback_handler)
         self.toggle_recording = ToggleRecordingHandler(config_manager, callback_handler)
 
+        self._ptt_keys = frozenset()
+        self._toggle_keys = frozenset()
+        self._hot_keys = frozenset()
+        self._last_keys_frozen = None
+        self._refresh_hot_keys()
+
         self.start_listening()
 
+    def _refresh_hot_keys(self):
+        """Collect the keys of each configured hotkey"""
+        self._ptt_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', []))
+        self._toggle_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', []))
+        self._hot_keys = self._ptt_keys | self._toggle_keys
+        self._last_keys_frozen = None
+
     def start_listening(self):
         """Start listening for hotkeys"""
         try:
@@ -49,6 +71,9 @@ class HotkeyManager:
 
     def update_hotkeys(self):
         """Update hotkeys from config"""
+        self._refresh_hot_keys()
+        self.push_to_talk.refresh_keys()
+        self.toggle_recording.refresh_keys()
         logger.info("Hotkeys updated from config")
 
     def _on_key_press(self, key):
@@ -60,11 +85,16 @@ class HotkeyManager:
             key_name = self._get_key_name(key)
             if key_name:
                 self.current_keys.add(key_name)
-                logger.debug(f"Key pressed: {key_name}, Current: {self.current_keys}")
 
-                # Check both handlers
-                self.push_to_talk.check_activation(self.current_keys)
-                self.toggle_recording.check_activation(self.current_keys)
+                # Keys outside every hotkey cannot complete a combination
+                if key_name not in self._hot_keys or not self._keys_changed():
+                    return
+
+                # Only a handler whose combination contains the key can change state
+                if key_name in self._ptt_keys:
+                    self.push_to_talk.check_activation(self.current_keys)
+                if key_name in self._toggle_keys:
+                    self.toggle_recording.check_activation(self.current_keys)
 
         except Exception as e:
             logger.error(f"Error handling key press: {e}")
@@ -78,30 +108,37 @@ class HotkeyManager:
             key_name = self._get_key_name(key)
             if key_name:
                 self.current_keys.discard(key_name)
-                logger.debug(f"Key released: {key_name}, Current: {self.current_keys}")
+
+                # Releasing a key outside every hotkey cannot break a combination
+                if key_name not in self._hot_keys or not self._keys_changed():
+                    return
 
                 # Check push-to-talk release
-                self.push_to_talk.check_activation(self.current_keys)
+                if key_name in self._ptt_keys:
+                    self.push_to_talk.check_activation(self.current_keys)
 
         except Exception as e:
             logger.error(f"Error handling key release: {e}")
 
+    def _keys_changed(self):
+        """True when the held keys differ from the last dispatched set (skips auto-repeat)"""
+        snapshot = frozenset(self.current_keys)
+        if snapshot == self._last_keys_frozen:
+            return False
+        self._last_keys_frozen = snapshot
+        return True
+
     def _get_key_name(self, key):
         """Get standardized key name"""
         try:
-            if hasattr(key, 'char') and key.char and key.char.isprintable():
-                return key.char.lower()
-            elif hasattr(key, 'name'):
-                name_mapping = {
-                    'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
-                    'alt_l': 'alt', 'alt_r': 'alt',
-                    'shift_l': 'shift', 'shift_r': 'shift',
-                    'cmd': 'win', 'cmd_l': 'win', 'cmd_r': 'win',
-                    'win': 'win', 'win_l': 'win', 'win_r': 'win'
-                }
-                key_name = key.name.lower()
-                return name_mapping.get(key_name, key_name)
-            else:
-                return str(key).lower().replace('key.', '').replace('<', '').replace('>', '')
+            # KeyCode carries .char, the Key enum carries .name
+            char = getattr(key, 'char', None)
+            if char and char.isprintable():
+                return char.lower()
+            name = getattr(key, 'name', None)
+            if name:
+                name = name.lower()
+                return self._NAME_MAP.get(name, name)
+            return str(key).rsplit('.', 1)[-1].strip('<>').lower()
         except Exception:
             return None
@@ -26,7 +26,7 @@ from ..features.hey_soffy import HeySoffyHandler
 # Initialize UI components
 from ..ui.main_window import MainWindow
 from ..ui.background_popup import BackgroundPopup
-from ..utils.auto_start import AutoStartManager
+from ..utils.auto_start import AutoStartManager, StartupFolderManager
 from ..ui.settings_window import SettingsWindow
 
 logger = logging.getLogger(__name__)
@@ -45,11 +45,19 @@ class VoiceTypeProApp:
         self.text_injector = TextInjector()
 
         self.hotkey_manager = HotkeyManager(self.config, self)
-        self.hey_soffy = HeySoffyHandler(self.config, self.transcriber.model, self.sound_manager, self)
+        self.hey_soffy = HeySoffyHandler(self.config, self.transcriber, self.sound_manager, self)
 
         self.main_window = MainWindow(self.config, self)
         self.background_popup = BackgroundPopup(self)
-        self.auto_start_manager = AutoStartManager()
+        # 'registry' (HKCU Run key) or 'startup_folder' (shortcut in the Startup folder)
+        if self.config.get('ui.auto_start_method', 'registry') == 'startup_folder':
+            self.auto_start_manager, other = StartupFolderManager(), AutoStartManager()
+        else:
+            self.auto_start_manager, other = AutoStartManager(), StartupFolderManager()
+        # After a method change, move the entry over so the app is never launched twice;
+        # the old entry is only removed once the new one is in place
+        if other.is_auto_start_enabled() and self.auto_start_manager.enable_auto_start():
+            other.disable_auto_start()
 
         # Application state
         self.is_recording = False
@@ -196,7 +204,7 @@ class VoiceTypeProApp:
     def _transcribe_and_paste(self, audio_data):
         """Transcribe audio and paste text"""
         try:
-            text = self.transcriber.transcribe(audio_data)
+            text = self.transcriber.transcribe(audio_data, on_segment=self._on_transcribed_segment)
 
             if text and len(text.strip()) > 0:
                 self.main_window.add_transcription_to_log(text)
@@ -217,6 +225,10 @@ class VoiceTypeProApp:
 
         self._reset_status_delayed()
 
+    def _on_transcribed_segment(self, segment_text):
+        """Show each decoded segment while the rest of the clip is still being transcribed"""
+        self.main_window.update_status(f"Transcribing: {segment_text.strip()[:40]}", "yellow")
+
     def _reset_status_delayed(self):
         """Reset status after delay"""
         def reset():
@@ -286,7 +298,8 @@ class VoiceTypeProApp:
                 self.audio_recorder.stop_recording()
             self.audio_recorder.cleanup()
             self.hotkey_manager.stop_listening()
-            self.hey_soffy.stop_listening()
+            self.hey_soffy.close()
+            self.config.flush()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
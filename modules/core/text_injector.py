@@ -4,7 +4,7 @@
 # =============================================================================
 
 import pyperclip
-import time
+import sys
 import threading
 from pynput import keyboard
 from pynput.keyboard import Key
@@ -12,9 +12,44 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+IS_WINDOWS = sys.platform == 'win32'
+
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _VK_CONTROL = 0x11
+    _VK_V = 0x56
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUT(ctypes.Structure):
+        # Padding sizes the union to MOUSEINPUT, the largest INPUT member
+        _fields_ = [("type", wintypes.DWORD), ("ki", _KEYBDINPUT), ("_pad", ctypes.c_ubyte * 8)]
+
+    _user32 = ctypes.windll.user32
+
+    def _send_ctrl_v():
+        """Inject Ctrl+V as one atomic SendInput batch"""
+        events = (_INPUT * 4)(
+            _INPUT(_INPUT_KEYBOARD, _KEYBDINPUT(_VK_CONTROL, 0, 0, 0, 0)),
+            _INPUT(_INPUT_KEYBOARD, _KEYBDINPUT(_VK_V, 0, 0, 0, 0)),
+            _INPUT(_INPUT_KEYBOARD, _KEYBDINPUT(_VK_V, 0, _KEYEVENTF_KEYUP, 0, 0)),
+            _INPUT(_INPUT_KEYBOARD, _KEYBDINPUT(_VK_CONTROL, 0, _KEYEVENTF_KEYUP, 0, 0)),
+        )
+        if _user32.SendInput(4, events, ctypes.sizeof(_INPUT)) != 4:
+            raise ctypes.WinError()
+
 class TextInjector:
     """Optimized text injection"""
 
+    RESTORE_DELAY = 0.3  # Seconds the target app gets to read the clipboard
+
     def __init__(self):
         self.controller = keyboard.Controller()
 
@@ -28,24 +63,24 @@ class TextInjector:
             except:
                 pass
 
-            # Copy new text
+            # Copy new text (the clipboard write is synchronous, no settle delay needed)
             pyperclip.copy(text)
-            time.sleep(0.05)
+            sequence = _user32.GetClipboardSequenceNumber() if IS_WINDOWS else None
 
             # Paste using Ctrl+V
-            with self.controller.pressed(Key.ctrl):
-                self.controller.press('v')
-                self.controller.release('v')
+            self._send_paste()
 
-            # Restore clipboard after delay
+            # Restore clipboard once the target app has had time to read it
             def restore_clipboard():
-                time.sleep(0.5)
+                # Leave the clipboard alone if something else was copied meanwhile
+                if IS_WINDOWS and _user32.GetClipboardSequenceNumber() != sequence:
+                    return
                 try:
                     pyperclip.copy(original_clipboard)
                 except:
                     pass
 
-            threading.Timer(0.5, restore_clipboard).start()
+            threading.Timer(self.RESTORE_DELAY, restore_clipboard).start()
             logger.info(f"Text pasted: {text[:50]}...")
 
         except Exception as e:
@@ -55,3 +90,13 @@ class TextInjector:
                 self.controller.type(text)
             except Exception as e2:
                 logger.error(f"Error typing text: {e2}")
+
+    def _send_paste(self):
+        """Send Ctrl+V through the native input API where available"""
+        if IS_WINDOWS:
+            _send_ctrl_v()
+            return
+
+        with self.controller.pressed(Key.ctrl):
+            self.controller.press('v')
+            self.controller.release('v')
@@ -3,94 +3,281 @@
 # File: modules/core/whisper_transcriber.py
 # =============================================================================
 
-import whisper
+import os
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Filler words as whole whitespace-delimited tokens (so "um," or "likely" are kept)
+_FILLER_RE = re.compile(r'(?<!\S)(?:um|uh|er|ah|hmm|like)(?!\S)', re.IGNORECASE)
+# Lowercase letter at the start of the text or after a sentence terminator
+_SENT_RE = re.compile(r'(^|[.!?]\s+)([a-z])')
+
 class WhisperTranscriber:
     """Optimized Whisper transcriber"""
 
+    MODELS_DIR = Path.home() / ".voicetype_pro" / "models"
+    CONVERT_TIMEOUT = 900  # Seconds before a one-time int8 conversion is abandoned
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.model = None
         self.model_size = self.config.get('whisper.model_size', 'base')
         self.language = self.config.get('whisper.language', 'auto')
         self.task = self.config.get('whisper.task', 'transcribe')
+        # 'faster' (CTranslate2) or 'torch' (reference openai-whisper)
+        self.backend = self.config.get('whisper.backend', 'faster')
+        self._fp16 = False
+        self.batch_size = self.config.get('whisper.batch_size', 8)
+        self.cpu_threads = self.config.get('whisper.cpu_threads') or os.cpu_count() or 4
+        self.batched = None
+        # Held by transcriptions on the torch backend and by the background torch.compile warm-up
+        self._model_lock = threading.Lock()
+        self.refresh_behavior()
         self.load_model()
 
+    def refresh_behavior(self):
+        """Cache the post-processing flags (call after the behavior settings change)"""
+        self._pp_filler = bool(self.config.get('behavior.remove_filler_words', True))
+        self._pp_cap = bool(self.config.get('behavior.capitalize_sentences', True))
+        self._pp_punct = bool(self.config.get('behavior.auto_punctuation', True))
+
     def load_model(self):
         """Load Whisper model"""
         try:
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
+            if self.backend == 'torch':
+                # Must be set before torch (and its OpenMP runtime) is first imported
+                os.environ.setdefault("OMP_NUM_THREADS", str(self.cpu_threads))
+                import torch
+                import whisper
+
+                torch.set_num_threads(self.cpu_threads)
+
+                if torch.cuda.is_available():
+                    device = "cuda"
+                elif torch.backends.mps.is_available():
+                    device = "mps"
+                else:
+                    device = "cpu"
+                self._fp16 = device == "cuda"
+                logger.info(f"Loading Whisper model: {self.model_size} (openai-whisper, {device})")
+                self.model = whisper.load_model(self.model_size, device=device)
+                if device == "cuda" and hasattr(torch, "compile"):
+                    # Compiling takes tens of seconds; keep it off the startup path
+                    threading.Thread(target=self._compile_torch_model, args=(torch,), daemon=True).start()
+            else:
+                import ctranslate2
+
+                cuda = ctranslate2.get_cuda_device_count() > 0
+                self._device = "cuda" if cuda else "cpu"
+                self._compute_type = "int8_float16" if cuda else "int8"
+                logger.info(f"Loading Whisper model: {self.model_size} (faster-whisper, {self._device}, {self._compute_type}, {self.cpu_threads} threads)")
+                int8_path = self._int8_model_path()
+                self._set_faster_model(int8_path or self.model_size)
+                if int8_path is None:
+                    self._start_int8_conversion()
             logger.info("Whisper model loaded successfully")
         except Exception as e:
             logger.error(f"Error loading Whisper model: {e}")
             raise
 
-    def transcribe(self, audio_data, language=None):
-        """Transcribe audio data"""
+    def _compile_torch_model(self, torch):
+        """Fuse the encoder/decoder kernels with torch.compile and compile them before first use (background thread)"""
+        # A dictation arriving meanwhile waits for the lock instead of hitting a half-compiled model
+        with self._model_lock:
+            encoder, decoder = self.model.encoder, self.model.decoder
+            try:
+                self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead", fullgraph=False)
+                self.model.decoder = torch.compile(self.model.decoder, mode="reduce-overhead", fullgraph=False)
+                # Warm-up on one second of silence so compilation does not delay the first dictation
+                self.model.transcribe(np.zeros(16000, dtype=np.float32), fp16=self._fp16, language="en")
+                logger.info("Whisper model compiled with torch.compile")
+            except Exception as e:
+                logger.error(f"Error compiling Whisper model, using eager mode: {e}")
+                self.model.encoder, self.model.decoder = encoder, decoder
+
+    def _set_faster_model(self, model_path):
+        """Load a faster-whisper model and swap it in together with its batched pipeline"""
+        from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+        model = WhisperModel(
+            model_path,
+            device=self._device,
+            compute_type=self._compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=1
+        )
+        # Runs the encoder on several VAD speech chunks of a clip at once
+        self.model, self.batched = model, BatchedInferencePipeline(model=model)
+
+    def _int8_model_path(self):
+        """Return the locally converted int8 CTranslate2 model, or None if not converted yet"""
+        dest = self.MODELS_DIR / f"whisper-{self.model_size}-int8"
+        if (dest / "model.bin").exists():
+            return str(dest)
+        return None
+
+    def _start_int8_conversion(self):
+        """Convert the int8 model in the background; until then faster-whisper's own download is used"""
+        # A failed conversion is not retried at every launch; delete the marker to retry
+        failed_marker = self.MODELS_DIR / f"whisper-{self.model_size}-int8.failed"
+        converter = shutil.which("ct2-transformers-converter")
+        if not converter or failed_marker.exists():
+            return
+
+        threading.Thread(target=self._convert_int8_model, args=(converter, failed_marker), daemon=True).start()
+
+    def _convert_int8_model(self, converter, failed_marker):
+        """Run the one-time int8 conversion, then switch to the converted model"""
+        dest = self.MODELS_DIR / f"whisper-{self.model_size}-int8"
+        # Convert next to the destination so an interrupted run never looks complete
+        tmp = dest.with_name(dest.name + ".tmp")
+        hf_name = "large-v3" if self.model_size == "large" else self.model_size
+        try:
+            logger.info(f"Converting openai/whisper-{hf_name} to int8 in the background (one-time)")
+            proc = subprocess.Popen(
+                [converter, "--model", f"openai/whisper-{hf_name}", "--quantization", "int8",
+                 "--copy_files", "tokenizer.json", "preprocessor_config.json",
+                 "--output_dir", str(tmp), "--force"],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            )
+            # Abandon a download or conversion that hangs
+            watchdog = threading.Timer(self.CONVERT_TIMEOUT, proc.kill)
+            watchdog.start()
+            try:
+                for line in proc.stdout:
+                    if line.strip():
+                        logger.info(f"Model conversion: {line.strip()}")
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+            if returncode != 0:
+                raise RuntimeError(f"converter exited with code {returncode}")
+            shutil.rmtree(dest, ignore_errors=True)
+            os.replace(tmp, dest)
+
+            self._set_faster_model(str(dest))
+            logger.info("Switched to the converted int8 Whisper model")
+        except Exception as e:
+            logger.error(f"Error converting Whisper model to int8: {e}")
+            shutil.rmtree(tmp, ignore_errors=True)
+            try:
+                self.MODELS_DIR.mkdir(parents=True, exist_ok=True)
+                failed_marker.write_text(str(e))
+            except OSError:
+                pass
+
+    def transcribe(self, audio_data, language=None, on_segment=None):
+        """Transcribe audio data, passing each raw segment to on_segment as it is decoded"""
         if self.model is None:
             raise Exception("Whisper model not loaded")
 
         try:
-            # Prepare audio
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
+            # Language setting
+            lang = language or (None if self.language == 'auto' else self.language)
+
+            text = self.transcribe_raw(audio_data, lang, vad_filter=True, on_segment=on_segment).strip()
+            text = self._post_process_text(text)
+
+            logger.info(f"Transcription completed: {text[:50]}...")
+            return text
+
+        except Exception as e:
+            logger.error(f"Error during transcription: {e}")
+            return None
+
+    def transcribe_raw(self, audio_data, language=None, vad_filter=False, on_segment=None):
+        """Run the model with greedy decoding and return the unprocessed text"""
+        if self.model is None:
+            raise Exception("Whisper model not loaded")
+
+        # Prepare audio
+        owned = audio_data.dtype != np.float32
+        if owned:
+            audio_data = audio_data.astype(np.float32)
 
-            # Normalize
-            max_val = np.max(np.abs(audio_data))
+        if self.backend == 'torch':
+            # Normalize: one reduction, then a multiply (in place when the array is ours)
+            max_val = np.abs(audio_data).max()
             if max_val > 0:
-                audio_data = audio_data / max_val
+                scale = np.float32(1.0 / max_val)
+                audio_data = np.multiply(audio_data, scale, out=audio_data if owned else None)
 
-            # Language setting
-            lang = language or (None if self.language == 'auto' else self.language)
+            with self._model_lock:
+                result = self.model.transcribe(
+                    audio_data,
+                    language=language,
+                    task=self.task,
+                    fp16=self._fp16,
+                    temperature=0.0,
+                    best_of=1,
+                    beam_size=1,
+                    no_speech_threshold=0.6,
+                    logprob_threshold=-1.0
+                )
+            if on_segment:
+                for segment in result['segments']:
+                    on_segment(segment['text'])
+            return result['text']
 
-            # Transcribe with optimized settings
-            result = self.model.transcribe(
+        # CTranslate2 computes the log-mel features itself, no normalization needed
+        if vad_filter:
+            segments, info = self.batched.transcribe(
                 audio_data,
-                language=lang,
+                language=language,
                 task=self.task,
-                fp16=False,
                 temperature=0.0,
-                best_of=1,
                 beam_size=1,
-                no_speech_threshold=0.6,
-                logprob_threshold=-1.0
+                batch_size=self.batch_size,
+                vad_filter=True
             )
+            return self._collect_segments(segments, on_segment)
 
-            text = result['text'].strip()
-            text = self._post_process_text(text)
+        segments, info = self.model.transcribe(
+            audio_data,
+            language=language,
+            task=self.task,
+            temperature=0.0,
+            best_of=1,
+            beam_size=1,
+            no_speech_threshold=0.6,
+            log_prob_threshold=-1.0,
+            condition_on_previous_text=False
+        )
+        return self._collect_segments(segments, on_segment)
 
-            logger.info(f"Transcription completed: {text[:50]}...")
-            return text
+    def _collect_segments(self, segments, on_segment):
+        """Drain faster-whisper's lazy segment generator, reporting each segment as it arrives"""
+        if on_segment is None:
+            return "".join(segment.text for segment in segments)
 
-        except Exception as e:
-            logger.error(f"Error during transcription: {e}")
-            return None
+        parts = []
+        for segment in segments:
+            parts.append(segment.text)
+            on_segment(segment.text)
+        return "".join(parts)
 
     def _post_process_text(self, text):
         """Enhanced text post-processing"""
-        if not text:
+        if not text or not (self._pp_filler or self._pp_cap or self._pp_punct):
             return text
 
         # Remove filler words
-        if self.config.get('behavior.remove_filler_words', True):
-            filler_words = ['um', 'uh', 'er', 'ah', 'hmm', 'like', 'you know']
-            words = text.split()
-            words = [word for word in words if word.lower() not in filler_words]
-            text = ' '.join(words)
+        if self._pp_filler:
+            text = ' '.join(_FILLER_RE.sub('', text).split())
 
         # Capitalize sentences
-        if self.config.get('behavior.capitalize_sentences', True):
-            sentences = text.split('. ')
-            sentences = [s.strip().capitalize() for s in sentences if s.strip()]
-            text = '. '.join(sentences)
+        if self._pp_cap:
+            text = _SENT_RE.sub(lambda m: m.group(1) + m.group(2).upper(), text)
 
         # Auto punctuation
-        if self.config.get('behavior.auto_punctuation', True):
+        if self._pp_punct:
             if text and not text.endswith(('.', '!', '?')):
                 text += '.'
 
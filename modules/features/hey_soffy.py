@@ -6,32 +6,71 @@
 import threading
 import time
 import queue
-import pyaudio
+from collections import deque
+import sounddevice as sd
 import numpy as np
 import logging
 
+try:
+    from openwakeword.model import Model as WakeWordModel
+except ImportError:  # Optional: Whisper-based wake word check below
+    WakeWordModel = None
+
 logger = logging.getLogger(__name__)
 
 class HeySoffyHandler:
     """Handles Hey Soffy voice assistant functionality"""
 
-    def __init__(self, config_manager, whisper_model, sound_manager, callback_handler):
+    MIN_VOICED_FRACTION = 0.3  # Share of voiced chunks in the window before Whisper runs
+    MAX_QUEUED_CHUNKS = 16  # About one second of 1024-frame blocks; older audio is dropped
+
+    def __init__(self, config_manager, transcriber, sound_manager, callback_handler):
         self.config = config_manager
-        self.whisper_model = whisper_model
+        self.transcriber = transcriber
         self.sound_manager = sound_manager
         self.callback_handler = callback_handler
         self.is_listening = False
         self.wake_word = self.config.get('voice_assistant.wake_word', 'hey soffy').lower()
+        # Space-padded so the substring test only matches whole consecutive words
+        self._wake_needle = ' ' + ' '.join(self.wake_word.split()) + ' '
         self.sensitivity = self.config.get('voice_assistant.sensitivity', 0.5)
+        self._vad_thr2 = float(self.config.get('audio.voice_activation_threshold', 0.02)) ** 2
         self.buffer_duration = 3.0
         self.sample_rate = self.config.get('audio.sample_rate', 16000)
-        self.audio_buffer = []
+        # Ring buffer of the last buffer_duration seconds: write cursor plus fill level
+        self.max_samples = int(self.buffer_duration * self.sample_rate)
+        self.audio_buffer = np.zeros(self.max_samples, dtype=np.float32)
+        self.write_idx = 0
+        self.filled = 0
+        # Input for the wake-word transcription, reused by every check on the listen thread
+        self._wake_window = np.empty(int(self.sample_rate * 2.5), dtype=np.float32)
         self.buffer_lock = threading.Lock()
-        self.audio = None
         self.stream = None
+        self._stream_device = None
+        self._chunks = queue.Queue(maxsize=self.MAX_QUEUED_CHUNKS)  # Filled by the PortAudio callback
         self.listen_thread = None
+        self._stop_event = threading.Event()  # Replaced per session; set to stop that session
         self.last_detection_time = 0
         self.cooldown_period = 3.0  # seconds between detections
+        self.kws = self._load_wake_word_model()
+        # Reused int16 scratch for the keyword spotter's input (blocks are a fixed 1024 frames)
+        self._kws_scratch = np.empty(1024, dtype=np.int16)
+        # VAD decisions for the chunks of the 2.5 s window the wake-word check transcribes
+        self._vad_history = deque(maxlen=int(2.5 * self.sample_rate / 1024))
+
+    def _load_wake_word_model(self):
+        """Load the configured openWakeWord model, if any (None falls back to Whisper)"""
+        model_path = self.config.get('voice_assistant.wake_word_model')
+        if not model_path or WakeWordModel is None:
+            return None
+
+        try:
+            model = WakeWordModel(wakeword_models=[model_path], inference_framework='onnx')
+            logger.info(f"Wake word model loaded: {model_path}")
+            return model
+        except Exception as e:
+            logger.error(f"Error loading wake word model, using Whisper instead: {e}")
+            return None
 
     def start_listening(self):
         """Start listening for wake word"""
@@ -43,65 +82,108 @@ class HeySoffyHandler:
             logger.warning("Already listening for wake word")
             return
 
+        # Settings are re-read here because the settings window restarts listening on save
+        self._vad_thr2 = float(self.config.get('audio.voice_activation_threshold', 0.02)) ** 2
         self.is_listening = True
-        self.listen_thread = threading.Thread(target=self._listen_worker, daemon=True)
+        # Each session gets its own stop event and waits for the previous worker to finish,
+        # so two sessions never share the stream, the chunk queue or the ring buffer
+        self._stop_event = threading.Event()
+        self.listen_thread = threading.Thread(target=self._listen_worker,
+                                              args=(self._stop_event, self.listen_thread), daemon=True)
         self.listen_thread.start()
         logger.info("Hey Soffy listening started")
 
     def stop_listening(self):
-        """Stop listening for wake word"""
+        """Stop listening for wake word (the stream stays open for the next start)"""
         self.is_listening = False
+        self._stop_event.set()
         if self.stream:
             try:
-                self.stream.stop_stream()
-                self.stream.close()
+                self.stream.stop()
             except:
                 pass
-        if self.audio:
+        # Wake the worker so a quick restart never overlaps the old one
+        self._put_chunk(None)
+        if self.listen_thread and self.listen_thread is not threading.current_thread():
+            self.listen_thread.join(timeout=1.0)
+        logger.info("Hey Soffy listening stopped")
+
+    def close(self):
+        """Stop listening and release the input stream (application exit)"""
+        self.stop_listening()
+        if self.stream:
             try:
-                self.audio.terminate()
+                self.stream.close()
             except:
                 pass
-        logger.info("Hey Soffy listening stopped")
+            self.stream = None
 
-    def _listen_worker(self):
-        """Worker thread for wake word detection"""
-        try:
-            self.audio = pyaudio.PyAudio()
+    def _open_stream(self):
+        """Open the input stream once, reopening only when the configured device changes"""
+        device = self.config.get('audio.device_index')
+        if self.stream is not None and device == self._stream_device:
+            return
+
+        if self.stream is not None:
+            self.stream.close()
 
-            self.stream = self.audio.open(
-                format=pyaudio.paFloat32,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=1024,
-                input_device_index=self.config.get('audio.device_index')
-            )
+        # Capture runs in PortAudio's callback thread; the listen loop only consumes chunks
+        self.stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            blocksize=1024,
+            dtype='float32',
+            channels=1,
+            device=device,
+            callback=self._audio_callback
+        )
+        self._stream_device = device
 
-            self.stream.start_stream()
+    def _listen_worker(self, stop_event, previous_thread):
+        """Worker thread for wake word detection (one per listening session)"""
+        # A previous session may still be finishing a Whisper check; it owns the stream until it exits
+        if previous_thread is not None:
+            previous_thread.join()
+        if stop_event.is_set():
+            return
 
-            while self.is_listening:
+        try:
+            self._open_stream()
+            self.stream.start()
+
+            while not stop_event.is_set():
                 try:
-                    data = self.stream.read(1024, exception_on_overflow=False)
-                    audio_chunk = np.frombuffer(data, dtype=np.float32)
-
-                    with self.buffer_lock:
-                        self.audio_buffer.extend(audio_chunk)
-                        # Keep only last N seconds
-                        max_samples = int(self.buffer_duration * self.sample_rate)
-                        if len(self.audio_buffer) > max_samples:
-                            self.audio_buffer = self.audio_buffer[-max_samples:]
-
-                    # Check for voice activity and wake word
-                    if self._detect_voice_activity(audio_chunk):
+                    try:
+                        audio_chunk = self._chunks.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    if audio_chunk is None:  # Stop requested
+                        continue
+
+                    # Keyword spotter: a few ms per chunk, Whisper never runs for detection
+                    if self.kws is not None:
+                        scratch = self._kws_scratch[:len(audio_chunk)]
+                        np.multiply(audio_chunk, 32767, out=scratch, casting='unsafe')
+                        scores = self.kws.predict(scratch)
+                        if max(scores.values(), default=0.0) > self.sensitivity and not stop_event.is_set():
+                            current_time = time.time()
+                            if current_time - self.last_detection_time > self.cooldown_period:
+                                self.last_detection_time = current_time
+                                self._on_wake_word_detected()
+                        continue
+
+                    self._write_ring(audio_chunk)
+
+                    # Check for voice activity and wake word; a single loud chunk in an
+                    # otherwise quiet window (click, door) is not worth a Whisper pass
+                    voiced = self._detect_voice_activity(audio_chunk)
+                    self._vad_history.append(voiced)
+                    if voiced and sum(self._vad_history) > self.MIN_VOICED_FRACTION * len(self._vad_history):
                         current_time = time.time()
                         if current_time - self.last_detection_time > self.cooldown_period:
-                            if self._check_for_wake_word():
+                            if self._check_for_wake_word() and not stop_event.is_set():
                                 self.last_detection_time = current_time
                                 self._on_wake_word_detected()
 
-                    time.sleep(0.01)  # Small delay
-
                 except Exception as e:
                     logger.error(f"Error in wake word listening: {e}")
                     time.sleep(0.1)
@@ -111,60 +193,81 @@ class HeySoffyHandler:
         finally:
             self._cleanup_audio()
 
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Hand each captured block to the listen worker (indata is reused after return)"""
+        self._put_chunk(indata[:, 0].copy())
+
+    def _put_chunk(self, item):
+        """Queue an item, dropping the oldest chunk when Whisper checks have fallen behind"""
+        chunks = self._chunks
+        while True:
+            try:
+                chunks.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    chunks.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _write_ring(self, audio_chunk):
+        """Copy a chunk into the ring buffer, wrapping at the end"""
+        n = min(len(audio_chunk), self.max_samples)
+        audio_chunk = audio_chunk[-n:]
+        with self.buffer_lock:
+            end = self.write_idx + n
+            if end <= self.max_samples:
+                self.audio_buffer[self.write_idx:end] = audio_chunk
+            else:
+                split = self.max_samples - self.write_idx
+                self.audio_buffer[self.write_idx:] = audio_chunk[:split]
+                self.audio_buffer[:n - split] = audio_chunk[split:]
+            self.write_idx = end % self.max_samples
+            self.filled = min(self.filled + n, self.max_samples)
+
+    def _read_ring(self, n_samples):
+        """Copy the newest n_samples in chronological order into the reused window (caller holds buffer_lock)"""
+        n = min(n_samples, self.filled, len(self._wake_window))
+        out = self._wake_window[:n]
+        start = self.write_idx - n
+        if start >= 0:
+            out[:] = self.audio_buffer[start:self.write_idx]
+        else:
+            out[:-start] = self.audio_buffer[start:]
+            out[-start:] = self.audio_buffer[:self.write_idx]
+        return out
+
     def _cleanup_audio(self):
-        """Cleanup audio resources"""
+        """Stop capture and reset per-session state (the stream itself is reused)"""
         try:
             if self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-                self.stream = None
-            if self.audio:
-                self.audio.terminate()
-                self.audio = None
+                self.stream.stop()
+            # Drop chunks captured before the stop so a restart starts fresh
+            self._chunks = queue.Queue(maxsize=self.MAX_QUEUED_CHUNKS)
+            self._vad_history.clear()
         except Exception as e:
             logger.error(f"Error during audio cleanup: {e}")
 
     def _detect_voice_activity(self, audio_chunk):
-        """Simple voice activity detection"""
-        rms = np.sqrt(np.mean(audio_chunk**2))
-        threshold = self.config.get('audio.voice_activation_threshold', 0.02)
-        return rms > threshold
+        """Simple voice activity detection (mean square vs squared threshold, one dot product)"""
+        return float(np.dot(audio_chunk, audio_chunk)) > self._vad_thr2 * audio_chunk.size
 
     def _check_for_wake_word(self):
         """Check if wake word is present in audio buffer"""
         try:
             with self.buffer_lock:
-                if len(self.audio_buffer) < self.sample_rate:
+                if self.filled < self.sample_rate:
                     return False
-                audio_data = np.array(self.audio_buffer[-int(self.sample_rate * 2.5):], dtype=np.float32)
-
-            # Normalize audio
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
-
-            # Quick transcription
-            result = self.whisper_model.transcribe(
-                audio_data,
-                task="transcribe",
-                language="en",
-                fp16=False,
-                temperature=0,
-                best_of=1,
-                beam_size=1
-            )
-
-            text = result['text'].lower().strip()
-            logger.debug(f"Wake word check: '{text}'")
+                audio_data = self._read_ring(int(self.sample_rate * 2.5))
 
-            # Check for wake word
-            wake_words = self.wake_word.split()
-            text_words = text.split()
+            # Quick transcription (greedy, English, no post-processing)
+            text = self.transcriber.transcribe_raw(audio_data, language="en").lower().strip()
+            logger.debug(f"Wake word check: '{text}'")
 
-            # Look for consecutive wake words in the text
-            for i in range(len(text_words) - len(wake_words) + 1):
-                if text_words[i:i+len(wake_words)] == wake_words:
-                    logger.info(f"Wake word detected in: '{text}'")
-                    return True
+            # Look for the wake words as consecutive words in the whitespace-normalized text
+            if self._wake_needle in ' ' + ' '.join(text.split()) + ' ':
+                logger.info(f"Wake word detected in: '{text}'")
+                return True
 
         except Exception as e:
             logger.error(f"Error checking wake word: {e}")
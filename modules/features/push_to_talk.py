@@ -18,16 +18,19 @@ class PushToTalkHandler:
         self.is_active = False
         self.current_keys = set()
         self.enabled = True
+        self.refresh_keys()
+
+    def refresh_keys(self):
+        """Cache the normalized push-to-talk combination (call after the config changes)"""
+        self._ptt_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', []))
 
     def check_activation(self, pressed_keys):
         """Check if push-to-talk keys are pressed"""
         if not self.enabled:
             return False
 
-        ptt_keys = set([k.lower().strip() for k in self.config.get('hotkeys.push_to_talk', [])])
-        current_keys_normalized = set([k.lower().strip() for k in pressed_keys])
-
-        should_activate = ptt_keys and ptt_keys.issubset(current_keys_normalized)
+        # pressed_keys are already normalized by HotkeyManager._get_key_name
+        should_activate = bool(self._ptt_keys) and self._ptt_keys.issubset(pressed_keys)
 
         if should_activate and not self.is_active:
             self.is_active = True
@@ -17,18 +17,21 @@ class ToggleRecordingHandler:
         self.last_toggle_time = 0
         self.enabled = True
         self.debounce_delay = 0.5  # seconds
+        self.refresh_keys()
+
+    def refresh_keys(self):
+        """Cache the normalized toggle combination (call after the config changes)"""
+        self._toggle_keys = frozenset(k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', []))
 
     def check_activation(self, pressed_keys):
         """Check if toggle recording keys are pressed"""
         if not self.enabled:
             return False
 
-        toggle_keys = set([k.lower().strip() for k in self.config.get('hotkeys.toggle_recording', [])])
-        current_keys_normalized = set([k.lower().strip() for k in pressed_keys])
-
         current_time = time.time()
 
-        if (toggle_keys and toggle_keys.issubset(current_keys_normalized) and
+        # pressed_keys are already normalized by HotkeyManager._get_key_name
+        if (self._toggle_keys and self._toggle_keys.issubset(pressed_keys) and
             current_time - self.last_toggle_time > self.debounce_delay):
 
             self.last_toggle_time = current_time
@@ -4,15 +4,83 @@
 # =============================================================================
 
 import customtkinter as ctk
+import re
 from tkinter import messagebox
 import threading
 import time
+from collections import deque
 from pynput import keyboard
 from pynput.keyboard import Key, Listener as KeyboardListener
 import logging
 
 logger = logging.getLogger(__name__)
 
+# pynput special key names -> names used in hotkey config
+_KEY_NAME_MAP = {
+    'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
+    'alt_l': 'alt', 'alt_r': 'alt',
+    'shift_l': 'shift', 'shift_r': 'shift',
+    'cmd': 'win', 'cmd_l': 'win', 'cmd_r': 'win',
+    'win': 'win', 'win_l': 'win', 'win_r': 'win'
+}
+_STRIP = str.maketrans('', '', '<>')
+# One key per match, separated by "+" with any spacing; a "+" in key position is the plus key
+_HOTKEY_KEY_RE = re.compile(r"\s*(\+|[^+]+?)\s*(?:\+|$)")
+_ENTRY_PROMPTS = ("No keys recorded", "Press your key combination...")
+_LLKHF_INJECTED = 0x10
+
+def _ignore_injected_keys(msg, data):
+    """win32_event_filter: drop synthesized keystrokes (e.g. a paste) before pynput decodes them"""
+    return not (data.flags & _LLKHF_INJECTED)
+
+# Whisper combo box labels keyed by the value stored in config
+_MODEL_DISPLAY = {
+    "tiny": "tiny - Fastest, least accurate (39 MB)",
+    "base": "base - Good balance (74 MB)",
+    "small": "small - Better accuracy (244 MB)",
+    "medium": "medium - High accuracy (769 MB)",
+    "large": "large - Best accuracy (1550 MB)"
+}
+_LANG_DISPLAY = {
+    "auto": "auto - Auto-detect",
+    "en": "en - English",
+    "es": "es - Spanish",
+    "fr": "fr - French",
+    "de": "de - German",
+    "it": "it - Italian",
+    "pt": "pt - Portuguese",
+    "ru": "ru - Russian",
+    "ja": "ja - Japanese",
+    "ko": "ko - Korean",
+    "zh": "zh - Chinese",
+    "ar": "ar - Arabic",
+    "hi": "hi - Hindi",
+    "te": "te - Telugu",
+    "tr": "tr - Turkish"
+}
+_MODEL_OPTIONS = list(_MODEL_DISPLAY.values())
+_LANG_OPTIONS = list(_LANG_DISPLAY.values())
+
+class _DeferredLabel:
+    """Slider value label redrawn at most once per Tk idle cycle while dragging"""
+
+    def __init__(self, label, fmt):
+        self.label = label
+        self.fmt = fmt
+        self._value = None
+        self._pending = False
+
+    def set(self, value):
+        """Record the latest value and schedule a single redraw"""
+        self._value = value
+        if not self._pending:
+            self._pending = True
+            self.label.after_idle(self._apply)
+
+    def _apply(self):
+        self._pending = False
+        self.label.configure(text=self.fmt.format(self._value))
+
 class SettingsWindow:
     """Enhanced settings window with modular tabs"""
 
@@ -33,21 +101,37 @@ class SettingsWindow:
         self.window.grab_set()
 
         # Main tabview
-        self.notebook = ctk.CTkTabview(self.window)
+        self.notebook = ctk.CTkTabview(self.window, command=self.on_tab_changed)
         self.notebook.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Initialize tabs
-        self.hotkeys_tab = HotkeysTab(self.notebook.add("Hotkeys"), self.config)
-        self.audio_tab = AudioTab(self.notebook.add("Audio"), self.config, self.app)
-        self.whisper_tab = WhisperTab(self.notebook.add("Transcription"), self.config)
-        self.voice_assistant_tab = VoiceAssistantTab(self.notebook.add("Voice Assistant"), self.config)
-        self.behavior_tab = BehaviorTab(self.notebook.add("Behavior"), self.config)
-        self.ui_tab = UITab(self.notebook.add("Interface"), self.config, self.app)
-        self.sounds_tab = SoundsTab(self.notebook.add("Sounds"), self.config)
+        # Create empty tabs; each body is built the first time it is selected
+        self._tab_builders = {
+            "Hotkeys": lambda frame: HotkeysTab(frame, self.config),
+            "Audio": lambda frame: AudioTab(frame, self.config, self.app),
+            "Transcription": lambda frame: WhisperTab(frame, self.config),
+            "Voice Assistant": lambda frame: VoiceAssistantTab(frame, self.config),
+            "Behavior": lambda frame: BehaviorTab(frame, self.config),
+            "Interface": lambda frame: UITab(frame, self.config, self.app),
+            "Sounds": lambda frame: SoundsTab(frame, self.config)
+        }
+        self._built_tabs = {}
+        for name in self._tab_builders:
+            self.notebook.add(name)
+        self.notebook.set("Hotkeys")
+        self.build_tab("Hotkeys")
 
         # Buttons
         self.setup_buttons()
 
+    def on_tab_changed(self):
+        """Build the selected tab on first view"""
+        self.build_tab(self.notebook.get())
+
+    def build_tab(self, name):
+        """Build a tab's widgets if they do not exist yet"""
+        if name not in self._built_tabs:
+            self._built_tabs[name] = self._tab_builders[name](self.notebook.tab(name))
+
     def setup_buttons(self):
         """Setup save/cancel buttons"""
         button_frame = ctk.CTkFrame(self.window)
@@ -62,39 +146,45 @@ class SettingsWindow:
     def save_settings(self):
         """Save all settings"""
         try:
-            # Save each tab's settings
-            self.hotkeys_tab.save_settings()
-            self.audio_tab.save_settings()
-            self.whisper_tab.save_settings()
-            self.voice_assistant_tab.save_settings()
-            self.behavior_tab.save_settings()
-            self.ui_tab.save_settings()
-            self.sounds_tab.save_settings()
-
-            # Update app components
-            self.app.main_window.update_hotkey_display()
-            self.app.hotkey_manager.update_hotkeys()
-
-            # Restart voice assistant if settings changed
-            va_enabled = self.config.get('voice_assistant.enabled', True)
-            if va_enabled:
-                self.app.hey_soffy.stop_listening()
-                time.sleep(0.1)
-                self.app.hey_soffy.start_listening()
-            else:
-                self.app.hey_soffy.stop_listening()
+            # Save each built tab's settings (unvisited tabs hold no edits), written to disk once
+            with self.config.batch() as changed:
+                for tab in self._built_tabs.values():
+                    tab.save_settings()
+
+            # Refresh only the app components whose settings section actually changed
+            if 'hotkeys' in changed:
+                self.app.main_window.update_hotkey_display()
+                self.app.hotkey_manager.update_hotkeys()
+            if 'behavior' in changed:
+                self.app.transcriber.refresh_behavior()
+
+            # Restart voice assistant off the Tk thread (stopping joins its audio worker)
+            if 'voice_assistant' in changed or 'audio' in changed:
+                va_enabled = self.config.get('voice_assistant.enabled', True)
+                threading.Thread(target=self._restart_voice_assistant, args=(va_enabled,), daemon=True).start()
 
-            messagebox.showinfo("Settings", "Settings saved successfully!")
             self.close_window()
+            messagebox.showinfo("Settings", "Settings saved successfully!")
 
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
             messagebox.showerror("Error", f"Failed to save settings: {e}")
 
+    def _restart_voice_assistant(self, enabled):
+        """Stop and, if enabled, restart wake-word listening so new settings apply"""
+        try:
+            self.app.hey_soffy.stop_listening()
+            if enabled:
+                time.sleep(0.1)
+                self.app.hey_soffy.start_listening()
+        except Exception as e:
+            logger.error(f"Error restarting voice assistant: {e}")
+
     def close_window(self):
         """Close settings window"""
-        if hasattr(self.hotkeys_tab, 'cleanup'):
-            self.hotkeys_tab.cleanup()
+        hotkeys_tab = self._built_tabs.get("Hotkeys")
+        if hotkeys_tab:
+            hotkeys_tab.cleanup()
         self.window.destroy()
 
 class HotkeysTab:
@@ -104,8 +194,18 @@ class HotkeysTab:
         self.tab = tab
         self.config = config
         self.recording_hotkey = None
-        self.current_keys = set()
+        self.current_keys = {}  # Insertion-ordered: keys render in the order pressed
+        self._pressed = set()  # Keys physically held right now, by _key_id
+        # Canonical lowercase key lists; the entries only display them
+        self._ptt_keys = []
+        self._toggle_keys = []
         self.key_listener = None
+        # Pending Tk after() tokens: release debounce and the 5 s recording limit
+        self._release_after_id = None
+        self._auto_stop_after_id = None
+        # Key events from the pynput thread, applied to the widgets by _drain_keys on the Tk thread
+        self._key_queue = deque()
+        self._poll_id = None
         self.setup_tab()
 
     def setup_tab(self):
@@ -164,19 +264,30 @@ class HotkeysTab:
 
     def load_current_hotkeys(self):
         """Load current hotkey values"""
-        ptt_keys = " + ".join(self.config.get('hotkeys.push_to_talk', [])).title()
-        toggle_keys = " + ".join(self.config.get('hotkeys.toggle_recording', [])).title()
+        self._ptt_keys = list(self.config.get('hotkeys.push_to_talk', []))
+        self._toggle_keys = list(self.config.get('hotkeys.toggle_recording', []))
 
         self.ptt_entry.delete(0, 'end')
-        self.ptt_entry.insert(0, ptt_keys)
+        self.ptt_entry.insert(0, self._format_keys(self._ptt_keys))
 
         self.toggle_entry.delete(0, 'end')
-        self.toggle_entry.insert(0, toggle_keys)
+        self.toggle_entry.insert(0, self._format_keys(self._toggle_keys))
+
+    @staticmethod
+    def _format_keys(keys):
+        """Display form of a key list"""
+        return " + ".join(keys).title()
 
     def start_recording_hotkey(self, hotkey_type):
         """Start recording hotkey"""
+        # Finish any recording in progress so only one listener ever exists
+        if self.recording_hotkey:
+            self.stop_recording_hotkey()
+        self._stop_listener()
+
         self.recording_hotkey = hotkey_type
         self.current_keys.clear()
+        self._pressed.clear()
 
         # Update UI
         if hotkey_type == 'ptt':
@@ -189,23 +300,35 @@ class HotkeysTab:
             self.toggle_entry.insert(0, "Press your key combination...")
 
         # Start listener
+        self._key_queue.clear()
+        self._cancel_after('_poll_id')
+        self._poll_id = self.tab.after(30, self._drain_keys)
+        # The global hook only exists while recording; the win32_ filter is ignored elsewhere
         self.key_listener = KeyboardListener(
             on_press=self._on_key_press,
-            on_release=self._on_key_release
+            on_release=self._on_key_release,
+            win32_event_filter=_ignore_injected_keys
         )
         self.key_listener.start()
 
         # Auto-stop after 5 seconds
-        threading.Timer(5.0, self.stop_recording_hotkey).start()
+        self._cancel_after('_auto_stop_after_id')
+        self._auto_stop_after_id = self.tab.after(5000, self.stop_recording_hotkey)
 
     def stop_recording_hotkey(self):
         """Stop recording hotkey"""
-        if self.key_listener:
-            self.key_listener.stop()
-            self.key_listener = None
+        self._cancel_after('_release_after_id')
+        self._cancel_after('_auto_stop_after_id')
+        self._cancel_after('_poll_id')
+        self._stop_listener()
 
         if self.recording_hotkey:
-            keys_text = " + ".join(sorted(self.current_keys)).title()
+            keys_text = self._format_keys(self.current_keys)
+            if self.current_keys:
+                if self.recording_hotkey == 'ptt':
+                    self._ptt_keys = list(self.current_keys)
+                else:
+                    self._toggle_keys = list(self.current_keys)
 
             if self.recording_hotkey == 'ptt':
                 self.ptt_entry.delete(0, 'end')
@@ -220,72 +343,120 @@ class HotkeysTab:
         self.current_keys.clear()
 
     def _on_key_press(self, key):
-        """Handle key press during recording"""
-        try:
-            key_name = self._get_key_name(key)
-            if key_name:
-                self.current_keys.add(key_name)
+        """Handle key press during recording (pynput thread: queue only, no widget access)"""
+        self._key_queue.append((True, self._key_id(key), self._get_key_name(key)))
+
+    def _on_key_release(self, key):
+        """Handle key release during recording (pynput thread: queue only, no widget access)"""
+        self._key_queue.append((False, self._key_id(key), None))
 
+    def _drain_keys(self):
+        """Apply queued key events on the Tk thread, updating the entry once per batch"""
+        self._poll_id = None
+        if not self.recording_hotkey:
+            return
+
+        try:
+            dirty = released = False
+            while self._key_queue:
+                is_press, key_id, key_name = self._key_queue.popleft()
+                if not is_press:
+                    self._pressed.discard(key_id)
+                    released = True
+                elif key_name:
+                    self._pressed.add(key_id)
+                    if key_name not in self.current_keys:
+                        # Auto-repeat of a held key changes nothing and costs no redraw
+                        self.current_keys[key_name] = None
+                        dirty = True
+
+            if dirty:
                 # Update display in real-time
-                keys_text = " + ".join(sorted(self.current_keys)).title()
-                if self.recording_hotkey == 'ptt':
-                    self.ptt_entry.delete(0, 'end')
-                    self.ptt_entry.insert(0, keys_text)
-                else:
-                    self.toggle_entry.delete(0, 'end')
-                    self.toggle_entry.insert(0, keys_text)
+                keys_text = self._format_keys(self.current_keys)
+                entry = self.ptt_entry if self.recording_hotkey == 'ptt' else self.toggle_entry
+                entry.delete(0, 'end')
+                entry.insert(0, keys_text)
+
+            # Auto-stop once the last held key is released: one trailing 500 ms timer,
+            # cancelled again if a key goes down before it fires
+            if self._pressed:
+                self._cancel_after('_release_after_id')
+            elif released and len(self.current_keys) > 0:
+                self._cancel_after('_release_after_id')
+                self._release_after_id = self.tab.after(500, self._check_recording_completion)
         except Exception as e:
             logger.error(f"Error during key recording: {e}")
 
-    def _on_key_release(self, key):
-        """Handle key release during recording"""
-        # Auto-stop when all keys are released
-        if len(self.current_keys) > 0:
-            threading.Timer(0.5, self._check_recording_completion).start()
+        if self.recording_hotkey:
+            self._poll_id = self.tab.after(30, self._drain_keys)
 
     def _check_recording_completion(self):
         """Check if recording should be completed"""
+        self._release_after_id = None
         if self.recording_hotkey and len(self.current_keys) > 0:
             self.stop_recording_hotkey()
 
+    def _cancel_after(self, attr):
+        """Cancel the pending after() callback stored in attr, if any"""
+        after_id = getattr(self, attr)
+        if after_id is not None:
+            try:
+                self.tab.after_cancel(after_id)
+            except Exception:
+                pass
+            setattr(self, attr, None)
+
+    def _key_id(self, key):
+        """Identify a physical key, stable between press and release even if its character changes"""
+        vk = getattr(key, 'vk', None)
+        if vk is not None:
+            return vk
+        # Special keys are Key enum members; character keys without a vk fall back to the char
+        return key if isinstance(key, Key) else getattr(key, 'char', None)
+
     def _get_key_name(self, key):
         """Get standardized key name"""
         try:
-            if hasattr(key, 'char') and key.char and key.char.isprintable():
-                return key.char.lower()
-            elif hasattr(key, 'name'):
-                name_mapping = {
-                    'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
-                    'alt_l': 'alt', 'alt_r': 'alt',
-                    'shift_l': 'shift', 'shift_r': 'shift',
-                    'cmd': 'win', 'cmd_l': 'win', 'cmd_r': 'win',
-                    'win': 'win', 'win_l': 'win', 'win_r': 'win'
-                }
-                key_name = key.name.lower()
-                return name_mapping.get(key_name, key_name)
-            else:
-                return str(key).lower().replace('key.', '').replace('<', '').replace('>', '')
+            char = getattr(key, 'char', None)
+            if char and char.isprintable():
+                return char.lower()
+            name = getattr(key, 'name', None)
+            if name is not None:
+                name = name.lower()
+                return _KEY_NAME_MAP.get(name, name)
+            return str(key).lower().removeprefix('key.').translate(_STRIP)
         except Exception:
             return None
 
     def save_settings(self):
         """Save hotkey settings"""
-        # Save push-to-talk
-        ptt_text = self.ptt_entry.get().strip()
-        if ptt_text and ptt_text not in ["No keys recorded", "Press your key combination..."]:
-            ptt_keys = [k.strip().lower() for k in ptt_text.split(" + ") if k.strip()]
-            self.config.set('hotkeys.push_to_talk', ptt_keys)
-
-        # Save toggle recording
-        toggle_text = self.toggle_entry.get().strip()
-        if toggle_text and toggle_text not in ["No keys recorded", "Press your key combination..."]:
-            toggle_keys = [k.strip().lower() for k in toggle_text.split(" + ") if k.strip()]
-            self.config.set('hotkeys.toggle_recording', toggle_keys)
+        self._save_entry(self.ptt_entry, self._ptt_keys, 'hotkeys.push_to_talk')
+        self._save_entry(self.toggle_entry, self._toggle_keys, 'hotkeys.toggle_recording')
+
+    def _save_entry(self, entry, keys, key_path):
+        """Store the canonical key list, parsing the entry only if it was edited by hand"""
+        text = entry.get().strip()
+        if not text or text in _ENTRY_PROMPTS:
+            return
+        if text != self._format_keys(keys):
+            keys = [k.lower() for k in _HOTKEY_KEY_RE.findall(text)]
+        self.config.set(key_path, keys)
 
     def cleanup(self):
         """Cleanup resources"""
-        if self.key_listener:
-            self.key_listener.stop()
+        self._cancel_after('_release_after_id')
+        self._cancel_after('_auto_stop_after_id')
+        self._cancel_after('_poll_id')
+        self._stop_listener()
+
+    def _stop_listener(self):
+        """Stop the key listener and wait briefly for its thread to exit"""
+        listener = self.key_listener
+        self.key_listener = None
+        if listener:
+            listener.stop()
+            if listener is not threading.current_thread():
+                listener.join(0.2)
 
 class AudioTab:
     """Audio configuration tab"""
@@ -298,6 +469,8 @@ class AudioTab:
 
     def setup_tab(self):
         """Setup audio tab"""
+        audio = self.config.get('audio', {})  # Snapshot the section once instead of a dotted lookup per widget
+
         # Device selection
         device_frame = ctk.CTkFrame(self.tab)
         device_frame.pack(fill="x", padx=10, pady=10)
@@ -317,7 +490,7 @@ class AudioTab:
         ctk.CTkLabel(rate_frame, text="Sample Rate:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
         self.sample_rate_combo = ctk.CTkComboBox(rate_frame, values=["8000", "16000", "22050", "44100", "48000"])
         self.sample_rate_combo.pack(fill="x", padx=10, pady=5)
-        self.sample_rate_combo.set(str(self.config.get('audio.sample_rate', 16000)))
+        self.sample_rate_combo.set(str(audio.get('sample_rate', 16000)))
 
         # Voice activation threshold
         threshold_frame = ctk.CTkFrame(self.tab)
@@ -327,21 +500,26 @@ class AudioTab:
 
         self.threshold_slider = ctk.CTkSlider(threshold_frame, from_=0.005, to=0.1, number_of_steps=19)
         self.threshold_slider.pack(fill="x", padx=10, pady=5)
-        self.threshold_slider.set(self.config.get('audio.voice_activation_threshold', 0.02))
+        self.threshold_slider.set(audio.get('voice_activation_threshold', 0.02))
 
         self.threshold_label = ctk.CTkLabel(threshold_frame, text="0.02")
         self.threshold_label.pack(padx=10, pady=2)
+        self._threshold_text = _DeferredLabel(self.threshold_label, "{:.3f}")
         self.threshold_slider.configure(command=self.update_threshold_label)
 
     def update_threshold_label(self, value):
         """Update threshold label"""
-        self.threshold_label.configure(text=f"{value:.3f}")
+        self._threshold_text.set(value)
 
     def save_settings(self):
         """Save audio settings"""
-        self.config.set('audio.sample_rate', int(self.sample_rate_combo.get()))
+        rate_changed = self.config.set('audio.sample_rate', int(self.sample_rate_combo.get()))
         self.config.set('audio.voice_activation_threshold', self.threshold_slider.get())
 
+        # Re-enumerate on the next visit when the capture format changed
+        if rate_changed:
+            self.app.audio_recorder.invalidate_device_cache()
+
 class WhisperTab:
     """Whisper configuration tab"""
 
@@ -352,28 +530,17 @@ class WhisperTab:
 
     def setup_tab(self):
         """Setup whisper tab"""
+        whisper = self.config.get('whisper', {})
+
         # Model size
         model_frame = ctk.CTkFrame(self.tab)
         model_frame.pack(fill="x", padx=10, pady=10)
 
         ctk.CTkLabel(model_frame, text="Whisper Model Size:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
 
-        model_options = [
-            "tiny - Fastest, least accurate (39 MB)",
-            "base - Good balance (74 MB)",
-            "small - Better accuracy (244 MB)",
-            "medium - High accuracy (769 MB)",
-            "large - Best accuracy (1550 MB)"
-        ]
-
-        self.model_combo = ctk.CTkComboBox(model_frame, values=model_options)
+        self.model_combo = ctk.CTkComboBox(model_frame, values=_MODEL_OPTIONS)
         self.model_combo.pack(fill="x", padx=10, pady=5)
-
-        current_model = self.config.get('whisper.model_size', 'base')
-        for option in model_options:
-            if option.startswith(current_model):
-                self.model_combo.set(option)
-                break
+        self.model_combo.set(_MODEL_DISPLAY.get(whisper.get('model_size', 'base'), _MODEL_OPTIONS[0]))
 
         # Language
         lang_frame = ctk.CTkFrame(self.tab)
@@ -381,32 +548,9 @@ class WhisperTab:
 
         ctk.CTkLabel(lang_frame, text="Language:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
 
-        languages = [
-            "auto - Auto-detect",
-            "en - English",
-            "es - Spanish",
-            "fr - French",
-            "de - German",
-            "it - Italian",
-            "pt - Portuguese",
-            "ru - Russian",
-            "ja - Japanese",
-            "ko - Korean",
-            "zh - Chinese",
-            "ar - Arabic",
-            "hi - Hindi",
-            "te - Telugu",
-            "tr - Turkish"
-        ]
-
-        self.language_combo = ctk.CTkComboBox(lang_frame, values=languages)
+        self.language_combo = ctk.CTkComboBox(lang_frame, values=_LANG_OPTIONS)
         self.language_combo.pack(fill="x", padx=10, pady=5)
-
-        current_lang = self.config.get('whisper.language', 'auto')
-        for lang in languages:
-            if lang.startswith(current_lang):
-                self.language_combo.set(lang)
-                break
+        self.language_combo.set(_LANG_DISPLAY.get(whisper.get('language', 'auto'), _LANG_OPTIONS[0]))
 
         # Task
         task_frame = ctk.CTkFrame(self.tab)
@@ -415,18 +559,18 @@ class WhisperTab:
         ctk.CTkLabel(task_frame, text="Task:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
         self.task_combo = ctk.CTkComboBox(task_frame, values=["transcribe", "translate"])
         self.task_combo.pack(fill="x", padx=10, pady=5)
-        self.task_combo.set(self.config.get('whisper.task', 'transcribe'))
+        self.task_combo.set(whisper.get('task', 'transcribe'))
 
     def save_settings(self):
         """Save whisper settings"""
         # Extract model size from selection
         model_selection = self.model_combo.get()
-        model_size = model_selection.split(' ')[0]
+        model_size = model_selection.partition(' ')[0]
         self.config.set('whisper.model_size', model_size)
 
         # Extract language code
         lang_selection = self.language_combo.get()
-        lang_code = lang_selection.split(' ')[0]
+        lang_code = lang_selection.partition(' ')[0]
         self.config.set('whisper.language', lang_code)
 
         self.config.set('whisper.task', self.task_combo.get())
@@ -441,10 +585,12 @@ class VoiceAssistantTab:
 
     def setup_tab(self):
         """Setup voice assistant tab"""
+        voice_assistant = self.config.get('voice_assistant', {})
+
         # Enable/disable
         self.va_enabled = ctk.CTkSwitch(self.tab, text="Enable 'Hey Soffy' Voice Assistant", font=ctk.CTkFont(size=14, weight="bold"))
         self.va_enabled.pack(anchor="w", padx=10, pady=15)
-        if self.config.get('voice_assistant.enabled', True):
+        if voice_assistant.get('enabled', True):
             self.va_enabled.select()
 
         # Wake word
@@ -454,7 +600,7 @@ class VoiceAssistantTab:
         ctk.CTkLabel(wake_frame, text="Wake Word:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
         self.wake_word_entry = ctk.CTkEntry(wake_frame, placeholder_text="hey soffy")
         self.wake_word_entry.pack(fill="x", padx=10, pady=5)
-        self.wake_word_entry.insert(0, self.config.get('voice_assistant.wake_word', 'hey soffy'))
+        self.wake_word_entry.insert(0, voice_assistant.get('wake_word', 'hey soffy'))
 
         # Sensitivity
         sens_frame = ctk.CTkFrame(self.tab)
@@ -464,10 +610,11 @@ class VoiceAssistantTab:
 
         self.sensitivity_slider = ctk.CTkSlider(sens_frame, from_=0.1, to=1.0, number_of_steps=9)
         self.sensitivity_slider.pack(fill="x", padx=10, pady=5)
-        self.sensitivity_slider.set(self.config.get('voice_assistant.sensitivity', 0.5))
+        self.sensitivity_slider.set(voice_assistant.get('sensitivity', 0.5))
 
         self.sensitivity_label = ctk.CTkLabel(sens_frame, text="0.5")
         self.sensitivity_label.pack(padx=10, pady=2)
+        self._sensitivity_text = _DeferredLabel(self.sensitivity_label, "{:.1f}")
         self.sensitivity_slider.configure(command=self.update_sensitivity_label)
 
         # Auto-stop timeout
@@ -478,19 +625,20 @@ class VoiceAssistantTab:
 
         self.timeout_slider = ctk.CTkSlider(timeout_frame, from_=1.0, to=10.0, number_of_steps=18)
         self.timeout_slider.pack(fill="x", padx=10, pady=5)
-        self.timeout_slider.set(self.config.get('voice_assistant.auto_stop_timeout', 3.0))
+        self.timeout_slider.set(voice_assistant.get('auto_stop_timeout', 3.0))
 
         self.timeout_label = ctk.CTkLabel(timeout_frame, text="3.0")
         self.timeout_label.pack(padx=10, pady=2)
+        self._timeout_text = _DeferredLabel(self.timeout_label, "{:.1f}")
         self.timeout_slider.configure(command=self.update_timeout_label)
 
     def update_sensitivity_label(self, value):
         """Update sensitivity label"""
-        self.sensitivity_label.configure(text=f"{value:.1f}")
+        self._sensitivity_text.set(value)
 
     def update_timeout_label(self, value):
         """Update timeout label"""
-        self.timeout_label.configure(text=f"{value:.1f}")
+        self._timeout_text.set(value)
 
     def save_settings(self):
         """Save voice assistant settings"""
@@ -509,6 +657,8 @@ class BehaviorTab:
 
     def setup_tab(self):
         """Setup behavior tab"""
+        behavior = self.config.get('behavior', {})
+
         # Text processing
         processing_frame = ctk.CTkFrame(self.tab)
         processing_frame.pack(fill="x", padx=10, pady=10)
@@ -517,17 +667,17 @@ class BehaviorTab:
 
         self.auto_punctuation = ctk.CTkCheckBox(processing_frame, text="Add automatic punctuation")
         self.auto_punctuation.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('behavior.auto_punctuation', True):
+        if behavior.get('auto_punctuation', True):
             self.auto_punctuation.select()
 
         self.capitalize_sentences = ctk.CTkCheckBox(processing_frame, text="Capitalize sentences")
         self.capitalize_sentences.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('behavior.capitalize_sentences', True):
+        if behavior.get('capitalize_sentences', True):
             self.capitalize_sentences.select()
 
         self.remove_filler_words = ctk.CTkCheckBox(processing_frame, text="Remove filler words (um, uh, etc.)")
         self.remove_filler_words.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('behavior.remove_filler_words', True):
+        if behavior.get('remove_filler_words', True):
             self.remove_filler_words.select()
 
         # Confidence threshold
@@ -538,15 +688,16 @@ class BehaviorTab:
 
         self.confidence_slider = ctk.CTkSlider(conf_frame, from_=0.1, to=1.0, number_of_steps=9)
         self.confidence_slider.pack(fill="x", padx=10, pady=5)
-        self.confidence_slider.set(self.config.get('behavior.confidence_threshold', 0.7))
+        self.confidence_slider.set(behavior.get('confidence_threshold', 0.7))
 
         self.confidence_label = ctk.CTkLabel(conf_frame, text="0.7")
         self.confidence_label.pack(padx=10, pady=2)
+        self._confidence_text = _DeferredLabel(self.confidence_label, "{:.1f}")
         self.confidence_slider.configure(command=self.update_confidence_label)
 
     def update_confidence_label(self, value):
         """Update confidence label"""
-        self.confidence_label.configure(text=f"{value:.1f}")
+        self._confidence_text.set(value)
 
     def save_settings(self):
         """Save behavior settings"""
@@ -566,6 +717,8 @@ class UITab:
 
     def setup_tab(self):
         """Setup UI tab"""
+        ui = self.config.get('ui', {})
+
         # Theme
         theme_frame = ctk.CTkFrame(self.tab)
         theme_frame.pack(fill="x", padx=10, pady=10)
@@ -573,7 +726,7 @@ class UITab:
         ctk.CTkLabel(theme_frame, text="Theme:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=5)
         self.theme_combo = ctk.CTkComboBox(theme_frame, values=["dark", "light", "system"])
         self.theme_combo.pack(fill="x", padx=10, pady=5)
-        self.theme_combo.set(self.config.get('ui.theme', 'dark'))
+        self.theme_combo.set(ui.get('theme', 'dark'))
 
         # System integration
         integration_frame = ctk.CTkFrame(self.tab)
@@ -583,12 +736,12 @@ class UITab:
 
         self.minimize_to_tray = ctk.CTkCheckBox(integration_frame, text="Minimize to system tray")
         self.minimize_to_tray.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('ui.minimize_to_tray', True):
+        if ui.get('minimize_to_tray', True):
             self.minimize_to_tray.select()
 
         self.show_notifications = ctk.CTkCheckBox(integration_frame, text="Show desktop notifications")
         self.show_notifications.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('ui.show_notifications', True):
+        if ui.get('show_notifications', True):
             self.show_notifications.select()
 
         self.auto_start = ctk.CTkSwitch(integration_frame, text="Auto-start with Windows", command=self.on_auto_start_toggle)
@@ -599,14 +752,12 @@ class UITab:
     def on_auto_start_toggle(self):
         """Handle auto-start toggle"""
         try:
-            if self.auto_start.get():
-                success = self.app.auto_start_manager.enable_auto_start()
-                if not success:
+            enabled = bool(self.auto_start.get())
+            if not self.app.auto_start_manager.apply(enabled):
+                if enabled:
                     self.auto_start.deselect()
                     messagebox.showerror("Error", "Failed to enable auto-start")
-            else:
-                success = self.app.auto_start_manager.disable_auto_start()
-                if not success:
+                else:
                     self.auto_start.select()
                     messagebox.showerror("Error", "Failed to disable auto-start")
         except Exception as e:
@@ -622,9 +773,9 @@ class UITab:
         self.config.set('ui.show_notifications', bool(self.show_notifications.get()))
         self.config.set('ui.auto_start', bool(self.auto_start.get()))
 
-        # Apply theme change
+        # Apply theme change once the save click has returned (repaints every widget)
         if new_theme != old_theme:
-            ctk.set_appearance_mode(new_theme)
+            self.app.main_window.root.after_idle(ctk.set_appearance_mode, new_theme)
 
 class SoundsTab:
     """Sounds configuration tab"""
@@ -636,6 +787,8 @@ class SoundsTab:
 
     def setup_tab(self):
         """Setup sounds tab"""
+        sounds = self.config.get('sounds', {})
+
         sounds_frame = ctk.CTkFrame(self.tab)
         sounds_frame.pack(fill="x", padx=10, pady=10)
 
@@ -643,22 +796,22 @@ class SoundsTab:
 
         self.sounds_enabled = ctk.CTkCheckBox(sounds_frame, text="Enable sound effects")
         self.sounds_enabled.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('sounds.enabled', True):
+        if sounds.get('enabled', True):
             self.sounds_enabled.select()
 
         self.start_sound = ctk.CTkCheckBox(sounds_frame, text="Start recording sound")
         self.start_sound.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('sounds.start_recording', True):
+        if sounds.get('start_recording', True):
             self.start_sound.select()
 
         self.stop_sound = ctk.CTkCheckBox(sounds_frame, text="Stop recording sound")
         self.stop_sound.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('sounds.stop_recording', True):
+        if sounds.get('stop_recording', True):
             self.stop_sound.select()
 
         self.wake_word_sound = ctk.CTkCheckBox(sounds_frame, text="Wake word detected sound")
         self.wake_word_sound.pack(anchor="w", padx=10, pady=3)
-        if self.config.get('sounds.wake_word_detected', True):
+        if sounds.get('wake_word_detected', True):
             self.wake_word_sound.select()
 
         # Volume control
@@ -669,15 +822,16 @@ class SoundsTab:
 
         self.volume_slider = ctk.CTkSlider(volume_frame, from_=0.1, to=1.0, number_of_steps=9)
         self.volume_slider.pack(fill="x", padx=10, pady=5)
-        self.volume_slider.set(self.config.get('sounds.volume', 0.7))
+        self.volume_slider.set(sounds.get('volume', 0.7))
 
         self.volume_label = ctk.CTkLabel(volume_frame, text="0.7")
         self.volume_label.pack(padx=10, pady=2)
+        self._volume_text = _DeferredLabel(self.volume_label, "{:.1f}")
         self.volume_slider.configure(command=self.update_volume_label)
 
     def update_volume_label(self, value):
         """Update volume label"""
-        self.volume_label.configure(text=f"{value:.1f}")
+        self._volume_text.set(value)
 
     def save_settings(self):
         """Save sound settings"""
@@ -3,62 +3,165 @@
 # File: modules/utils/auto_start.py
 # =============================================================================
 
-import winreg
 import sys
 import os
 import logging
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+# Script launched at login when running from source (modules/utils/ -> repository root)
+_ENTRY_SCRIPT = Path(__file__).resolve().parents[2] / "main.py"
+
+if sys.platform == 'win32':
+    import winreg
+
+    _HKCU = winreg.HKEY_CURRENT_USER
+    _open_key = winreg.OpenKeyEx
+    _query_value = winreg.QueryValueEx
+    _set_value = winreg.SetValueEx
+    _delete_value = winreg.DeleteValue
+else:  # Importable elsewhere; the Run key simply reads as disabled
+    winreg = None
+
 class AutoStartManager:
     """Windows auto-start management"""
 
     def __init__(self, app_name="VoiceType Pro"):
         self.app_name = app_name
-        self.registry_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
+        self._enabled = None  # Last known state; None until first read or write
+
+        # Command line written to the Run key; neither part changes while the app runs
+        exe_path = sys.executable
+        if exe_path.endswith("python.exe"):
+            self._command_line = f'"{exe_path}" "{_ENTRY_SCRIPT}"'
+        else:
+            self._command_line = f'"{exe_path}"'
 
     def is_auto_start_enabled(self):
-        """Check if auto-start is enabled"""
+        """Check if auto-start is enabled (cached until changed through this manager)"""
+        if self._enabled is not None:
+            return self._enabled
+        if winreg is None:
+            return False
+
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as key:
-                try:
-                    winreg.QueryValueEx(key, self.app_name)
-                    return True
-                except FileNotFoundError:
-                    return False
-        except Exception as e:
+            # Read-only access is all a lookup needs
+            with _open_key(_HKCU, _RUN_KEY, 0, winreg.KEY_QUERY_VALUE) as key:
+                _query_value(key, self.app_name)
+            self._enabled = True
+            return True
+        except FileNotFoundError:
+            # ERROR_FILE_NOT_FOUND: no Run value (or no Run key) for this app
+            self._enabled = False
+            return False
+        except OSError as e:
             logger.error(f"Error checking auto-start: {e}")
             return False
 
     def enable_auto_start(self):
         """Enable auto-start"""
+        if winreg is None:
+            logger.error("Auto-start is only supported on Windows")
+            return False
+
         try:
-            exe_path = sys.executable
-            if exe_path.endswith("python.exe"):
-                script_path = os.path.abspath(__file__)
-                exe_path = f'"{exe_path}" "{script_path}"'
-            else:
-                exe_path = f'"{exe_path}"'
+            exe_path = self._command_line
 
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_SET_VALUE) as key:
-                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, exe_path)
+            # Write and read back through one handle; the readback also refreshes the cache
+            access = winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE
+            with _open_key(_HKCU, _RUN_KEY, 0, access) as key:
+                try:
+                    current = _query_value(key, self.app_name)[0]
+                except FileNotFoundError:
+                    current = None
+                # An identical value needs no write (and wakes no registry watchers)
+                if current != exe_path:
+                    _set_value(key, self.app_name, 0, winreg.REG_SZ, exe_path)
+                    current = _query_value(key, self.app_name)[0]
+                self._enabled = current == exe_path
 
-            logger.info("Auto-start enabled")
-            return True
-        except Exception as e:
+            if self._enabled:
+                logger.info("Auto-start enabled")
+            return self._enabled
+        except OSError as e:
             logger.error(f"Error enabling auto-start: {e}")
             return False
 
     def disable_auto_start(self):
         """Disable auto-start"""
+        if winreg is None:
+            return True
+
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key, 0, winreg.KEY_SET_VALUE) as key:
+            with _open_key(_HKCU, _RUN_KEY, 0, winreg.KEY_SET_VALUE) as key:
                 try:
-                    winreg.DeleteValue(key, self.app_name)
+                    _delete_value(key, self.app_name)
                     logger.info("Auto-start disabled")
-                    return True
                 except FileNotFoundError:
-                    return True
+                    pass
+                self._enabled = False
+                return True
+        except OSError as e:
+            logger.error(f"Error disabling auto-start: {e}")
+            return False
+
+    def apply(self, enabled):
+        """Enable or disable auto-start, returning whether the change succeeded"""
+        return self.enable_auto_start() if enabled else self.disable_auto_start()
+
+
+class StartupFolderManager:
+    """Windows auto-start through a shortcut in the user's Startup folder"""
+
+    def __init__(self, app_name="VoiceType Pro"):
+        self.app_name = app_name
+        startup_dir = os.path.join(os.environ.get("APPDATA", ""), "Microsoft", "Windows",
+                                   "Start Menu", "Programs", "Startup")
+        self.shortcut_path = os.path.join(startup_dir, f"{app_name}.lnk")
+
+        # Same command the registry backend writes, split into target and arguments
+        self._target = sys.executable
+        self._arguments = ""
+        self._workdir = os.path.dirname(self._target)
+        if self._target.endswith("python.exe"):
+            self._arguments = f'"{_ENTRY_SCRIPT}"'
+            self._workdir = str(_ENTRY_SCRIPT.parent)
+
+    def is_auto_start_enabled(self):
+        """Check if auto-start is enabled (a single file attribute lookup)"""
+        return os.path.exists(self.shortcut_path)
+
+    def enable_auto_start(self):
+        """Enable auto-start"""
+        try:
+            import win32com.client
+
+            shortcut = win32com.client.Dispatch("WScript.Shell").CreateShortcut(self.shortcut_path)
+            shortcut.TargetPath = self._target
+            shortcut.Arguments = self._arguments
+            shortcut.WorkingDirectory = self._workdir
+            shortcut.Save()
+
+            logger.info("Auto-start enabled")
+            return True
         except Exception as e:
+            logger.error(f"Error enabling auto-start: {e}")
+            return False
+
+    def disable_auto_start(self):
+        """Disable auto-start"""
+        try:
+            os.remove(self.shortcut_path)
+            logger.info("Auto-start disabled")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             logger.error(f"Error disabling auto-start: {e}")
             return False
+        return True
+
+    def apply(self, enabled):
+        """Enable or disable auto-start, returning whether the change succeeded"""
+        return self.enable_auto_start() if enabled else self.disable_auto_start()